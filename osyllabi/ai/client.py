@@ -6,6 +6,7 @@ import time
 import os
 from typing import Any, Dict, List, Optional, Union, Callable, TypeVar
 import asyncio
+import weakref
 import httpx
 
 from ollama import AsyncClient
@@ -18,6 +19,10 @@ from osyllabi.config import AI_CONFIG
 # Type variable for generic return type annotations
 T = TypeVar('T')
 
+# Connection pool limits for the shared HTTP session to the Ollama server
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+HTTP_MAX_CONNECTIONS = 32
+
 @singleton
 class OllamaClient:
     """
@@ -77,11 +82,42 @@ class OllamaClient:
         
         log.info(f"Created output directory structure in: {self.output_dir}")
         
-        # Initialize Ollama client
-        self.client = AsyncClient(host=self.base_url)
+        # Ollama client with a pooled HTTP session, built per event loop on first use
+        self._async_client = None
+        self._client_loop = None
         self.last_request = {}  # Add this to store last request data for debugging
         self.last_response = {}  # Add this to store last response data for debugging
         
+    @property
+    def client(self) -> AsyncClient:
+        """
+        Get the Ollama client for the running event loop.
+        
+        Pooled httpx connections belong to the loop that opened them, so the
+        client is rebuilt when requests arrive from a different loop, e.g.
+        across separate asyncio.run() calls.
+        
+        Returns:
+            AsyncClient whose connection pool is reused within the current loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+            
+        bound_loop = self._client_loop() if self._client_loop else None
+        if self._async_client is None or loop is None or bound_loop is not loop:
+            self._async_client = AsyncClient(
+                host=self.base_url,
+                limits=httpx.Limits(
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=HTTP_MAX_CONNECTIONS
+                )
+            )
+            self._client_loop = weakref.ref(loop) if loop else None
+            
+        return self._async_client
+        
     async def initialize(self):
         """Initialize the client and validate server connection."""
         # Validate Ollama availability
@@ -326,8 +362,8 @@ class OllamaClient:
         model_name = model or self.default_model
         
         try:
-            # Use the ollama library's batch embedding method
-            response = await self.client.embeddings(model=model_name, prompt=texts)
+            # Use the ollama library's batch embedding method; embeddings() only takes one prompt
+            response = await self.client.embed(model=model_name, input=texts)
             
             # Extract embeddings from response
             embeddings = response.get("embeddings", [])
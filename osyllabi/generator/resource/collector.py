@@ -6,6 +6,7 @@ from various sources.
 """
 import abc
 import concurrent.futures
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Any, Union, Optional
 
@@ -87,13 +88,14 @@ class ResourceCollector:
             "success_rate": 0.0
         }
     
-    def collect(self, urls: List[str], paths: List[str]) -> Dict[str, Any]:
+    def collect(self, urls: List[str], paths: List[str], extract_keywords: bool = True) -> Dict[str, Any]:
         """
         Collect resources from URLs and file paths.
         
         Args:
             urls: List of URLs to collect from
             paths: List of file/directory paths to collect from
+            extract_keywords: Whether to extract keywords from content
             
         Returns:
             Dictionary of collected resources organized by source
@@ -111,7 +113,7 @@ class ResourceCollector:
         # Collect from URLs
         if urls:
             log.info(f"Processing {len(urls)} URLs")
-            url_resources = self.web_collector.collect(urls)
+            url_resources = self.web_collector.collect(urls, extract_keywords=extract_keywords)
             resources["urls"] = url_resources.get("urls", {})
             
             # Update metadata and stats
@@ -123,7 +125,7 @@ class ResourceCollector:
         # Collect from file paths
         if paths:
             log.info(f"Processing {len(paths)} file/directory paths")
-            file_resources = self.file_collector.collect(paths)
+            file_resources = self.file_collector.collect(paths, extract_keywords=extract_keywords)
             resources["files"] = file_resources.get("files", {})
             
             # Update metadata and stats
@@ -151,8 +153,12 @@ class ResourceCollector:
         if total_attempted > 0:
             self.stats["success_rate"] = total_succeeded / total_attempted
         
-        # Add overall statistics
+        # Add overall statistics, plus the longest content so truncation can be skipped
         resources["stats"] = self.stats.copy()
+        resources["stats"]["max_content_len"] = max(
+            (len(data.get("content", "")) for data in chain(resources["urls"].values(), resources["files"].values())),
+            default=0
+        )
         
         return resources
     
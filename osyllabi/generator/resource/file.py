@@ -156,11 +156,12 @@ class FileResourceCollector:
             "processing_time_seconds": 0
         }
         
-    def collect(self, paths: List[str]) -> Dict[str, Any]:
+    def collect(self, paths: List[str], extract_keywords: bool = True) -> Dict[str, Any]:
         """Collect resources from the specified file paths.
         
         Args:
             paths: List of file paths or directories to process
+            extract_keywords: Whether to extract keywords from content
             
         Returns:
             Dictionary with collected resources
@@ -201,8 +202,8 @@ class FileResourceCollector:
                 resources[resource_key] = content
                 
                 # Extract and collect keywords
-                extracted_keywords = self._extract_keywords(content.get("content", ""))
-                keywords.update(extracted_keywords)
+                if extract_keywords:
+                    keywords.update(self._extract_keywords(content.get("content", "")))
                 
                 # Update statistics
                 self.stats["files_processed"] += 1
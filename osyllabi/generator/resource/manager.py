@@ -4,14 +4,198 @@ Resource manager for coordinating collection and extraction of content.
 This module provides a high-level interface for managing the process of collecting
 and extracting resources from various sources.
 """
-import re
+import hashlib
 import importlib.util
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
 
+import numpy as np
+
 from osyllabi.utils.log import log
 from osyllabi.generator.resource.collector import ResourceCollector
 
+# Near-duplicate detection parameters (MinHash over byte shingles + LSH banding)
+SHINGLE_SIZE = 10
+ROLLING_BASE = 131
+NUM_PERM = 128
+LSH_BANDS = 16
+LSH_ROWS = 8
+DEDUP_THRESHOLD = 0.8
+SIGNATURE_BLOCK = 512  # Shingles permuted per pass when building a signature
+
+_MERSENNE_61 = np.uint64((1 << 61) - 1)
+_UINT32_MAX = np.uint64(0xFFFFFFFF)
+
+# Permutation coefficients; fixed seed so signatures are stable across runs
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, _MERSENNE_61, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _MERSENNE_61, size=NUM_PERM, dtype=np.uint64)
+
+# ROLLING_BASE ** (SHINGLE_SIZE - 1 - j) modulo 2**64 for each window offset j
+_ROLLING_POWERS = np.array(
+    [pow(ROLLING_BASE, SHINGLE_SIZE - 1 - j, 1 << 64) for j in range(SHINGLE_SIZE)],
+    dtype=np.uint64
+)
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    """
+    Hash every shingle of a text with a rolling polynomial (Rabin-Karp) hash.
+    
+    The text is encoded to UTF-8 and each window of SHINGLE_SIZE bytes is
+    hashed as sum(b[i + j] * ROLLING_BASE ** (SHINGLE_SIZE - 1 - j)) modulo
+    2**64. All windows are evaluated at once as a strided view times the
+    precomputed base powers.
+    
+    Args:
+        text: Normalized text
+        
+    Returns:
+        Array of unique 32-bit shingle hashes (uint64)
+    """
+    buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+    if buf.size < SHINGLE_SIZE:
+        buf = np.pad(buf, (0, SHINGLE_SIZE - buf.size))
+    windows = np.lib.stride_tricks.sliding_window_view(buf, SHINGLE_SIZE)
+    # The high bits of a polynomial hash modulo 2**64 are the best mixed
+    return np.unique((windows @ _ROLLING_POWERS) >> np.uint64(32))
+
+
+def _signature(content: str) -> np.ndarray:
+    """
+    Compute the MinHash signature of a piece of content.
+    
+    Content is lowercased and whitespace-normalized, and its shingles are
+    hashed with a rolling hash. Permutations are applied to blocks of
+    SIGNATURE_BLOCK shingles in a reused buffer, so the working set stays
+    cache-resident and no full-size temporaries are allocated.
+    
+    Args:
+        content: Text content to fingerprint
+        
+    Returns:
+        Array of NUM_PERM minimum hash values (uint32)
+    """
+    hashes = _shingle_hashes(' '.join(content.lower().split()))
+    signature = np.full(NUM_PERM, _UINT32_MAX, dtype=np.uint64)
+    buf = np.empty((min(SIGNATURE_BLOCK, hashes.size), NUM_PERM), dtype=np.uint64)
+    for start in range(0, hashes.size, SIGNATURE_BLOCK):
+        block = hashes[start:start + SIGNATURE_BLOCK]
+        permuted = buf[:block.size]
+        np.multiply(block[:, None], _PERM_A, out=permuted)
+        permuted += _PERM_B
+        np.remainder(permuted, _MERSENNE_61, out=permuted)
+        permuted &= _UINT32_MAX
+        np.minimum(signature, permuted.min(axis=0), out=signature)
+    return signature.astype(np.uint32)
+
+
+# Section headings for each kind of collected resource
+_SECTION_HEADINGS = {"urls": "## Web Resources", "files": "## Local Resources"}
+
+
+def _format_block(
+    kind: str,
+    items: Dict[str, Dict[str, Any]],
+    max_items: int,
+    snippet: int = 500,
+    end: str = ""
+) -> Iterator[str]:
+    """
+    Yield the heading and per-resource blocks for one kind of resource.
+    
+    Args:
+        kind: Resource kind, either "urls" or "files"
+        items: Mapping of URL or path to resource data
+        max_items: Maximum number of resources to include
+        snippet: Maximum number of content characters per resource
+        end: Suffix appended to the heading and every block
+        
+    Yields:
+        Formatted context pieces, heading first
+    """
+    if not items:
+        return
+        
+    yield f"{_SECTION_HEADINGS[kind]}{end}"
+    for key, data in islice(items.items(), max_items):
+        title = data.get("title", key if kind == "urls" else Path(key).name)
+        content = data.get("content", "")
+        yield f"### {title}\n{content[:snippet]}{'...' if len(content) > snippet else ''}{end}"
+
+
+def _max_content_len(
+    stats: Dict[str, Any],
+    urls_dict: Dict[str, Dict[str, Any]],
+    files_dict: Dict[str, Dict[str, Any]]
+) -> int:
+    """
+    Get the length of the longest content in a set of resources.
+    
+    Uses the "max_content_len" stat recorded by ResourceCollector when
+    present, and otherwise measures it.
+    
+    Args:
+        stats: Collection statistics
+        urls_dict: Collected URL resources
+        files_dict: Collected file resources
+        
+    Returns:
+        Length of the longest content
+    """
+    longest = stats.get("max_content_len")
+    if longest is None:
+        longest = max(
+            (len(data.get("content", "")) for data in chain(urls_dict.values(), files_dict.values())),
+            default=0
+        )
+    return longest
+
+
+class _MinHashLSH:
+    """
+    Locality-sensitive hash index over MinHash signatures.
+    
+    Signatures are kept in a contiguous (capacity, NUM_PERM) matrix and split
+    into LSH_BANDS bands of LSH_ROWS rows; two signatures become candidates
+    when any band matches exactly. Candidates are confirmed by their
+    estimated Jaccard similarity.
+    """
+    
+    def __init__(self, capacity: int, threshold: float = DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self._matrix = np.empty((max(capacity, 1), NUM_PERM), dtype=np.uint32)
+        self._keys: List[str] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(LSH_BANDS)]
+    
+    @staticmethod
+    def _bands(signature: np.ndarray):
+        return enumerate(row.tobytes() for row in signature.reshape(LSH_BANDS, LSH_ROWS))
+    
+    def query(self, signature: np.ndarray) -> List[str]:
+        """Return keys of indexed items similar to the given signature."""
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        if not candidates:
+            return []
+        
+        rows = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+        similarity = (self._matrix[rows] == signature).mean(axis=1)
+        return [self._keys[row] for row in rows[similarity >= self.threshold]]
+    
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Add a signature to the index under the given key."""
+        row = len(self._keys)
+        if row == len(self._matrix):
+            self._matrix = np.concatenate([self._matrix, np.empty_like(self._matrix)])
+        self._matrix[row] = signature
+        self._keys.append(key)
+        for band, band_key in self._bands(signature):
+            self._buckets[band].setdefault(band_key, []).append(row)
+
 
 class ResourceManager:
     """
@@ -74,19 +258,15 @@ class ResourceManager:
         log.info(f"Processing {len(urls)} URLs and {len(paths)} paths")
         
         # Collect resources
-        resources = self.collector.collect(urls, paths)
+        resources = self.collector.collect(urls, paths, extract_keywords=extract_keywords)
         
-        # Post-process resources
-        if deduplicate:
-            resources = self._deduplicate_resources(resources)
-            
-        # Truncate content if needed
-        resources = self._truncate_content(resources)
+        # Deduplicate and truncate content in a single pass
+        resources, content_size = self._postprocess(resources, deduplicate=deduplicate)
         
-        # Update statistics
+        # Update statistics; content size is the size of what was kept
         self.stats["sources_processed"] = len(urls) + len(paths)
-        self.stats["total_content_size"] = resources["stats"].get("total_content_size", 0)
-        self.stats["keywords_extracted"] = len(resources["metadata"].get("keywords", []))
+        self.stats["total_content_size"] = content_size
+        self.stats["keywords_extracted"] = len(resources["metadata"]["keywords"]) if extract_keywords else 0
         
         log.info(f"Processed {self.stats['sources_processed']} sources, "
                 f"extracted {self.stats['keywords_extracted']} keywords")
@@ -117,96 +297,118 @@ class ResourceManager:
         Returns:
             Formatted context string
         """
+        urls_dict = resources.get("urls") or {}
+        files_dict = resources.get("files") or {}
+        metadata = resources.get("metadata") or {}
+        
         context_parts = []
         
-        # Include most relevant URL content
-        urls = list(resources.get("urls", {}).items())
-        if urls:
-            context_parts.append("## Web Resources\n")
-            for i, (url, data) in enumerate(urls[:max_items]):
-                title = data.get("title", url)
-                content = data.get("content", "")
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                context_parts.append(f"### {title}\n{content}\n")
-        
-        # Include most relevant file content
-        files = list(resources.get("files", {}).items())
-        if files:
-            context_parts.append("## Local Resources\n")
-            for i, (path, data) in enumerate(files[:max_items]):
-                title = data.get("title", Path(path).name)
-                content = data.get("content", "")
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                context_parts.append(f"### {title}\n{content}\n")
+        # Include most relevant URL and file content
+        context_parts.extend(_format_block("urls", urls_dict, max_items, end="\n"))
+        context_parts.extend(_format_block("files", files_dict, max_items, end="\n"))
         
         # Include keywords
-        keywords = resources.get("metadata", {}).get("keywords", [])
+        keywords = metadata.get("keywords") or []
         if keywords:
             keyword_str = ", ".join(keywords[:20])
             context_parts.append(f"## Keywords\n{keyword_str}")
             
         return "\n\n".join(context_parts)
     
-    def _deduplicate_resources(self, resources: Dict[str, Any]) -> Dict[str, Any]:
+    def _postprocess(
+        self,
+        resources: Dict[str, Any],
+        deduplicate: bool = True,
+        truncate: bool = True
+    ) -> Tuple[Dict[str, Any], int]:
         """
-        Remove duplicate or very similar resources.
+        Deduplicate and truncate resource content in a single traversal.
+        
+        Each item is clipped to the maximum content length first, and the
+        MinHash signature is derived from the clipped text, so every content
+        buffer is only walked once. Exact copies are rejected by digest
+        before any signature is computed. The size of the kept content is
+        totalled in the same pass. When only truncation is requested and no
+        content exceeds the limit, the traversal is skipped entirely.
         
         Args:
-            resources: Resources to deduplicate
+            resources: Resources to process
+            deduplicate: Whether to remove duplicate or very similar resources
+            truncate: Whether to truncate content exceeding the maximum length
             
         Returns:
-            Deduplicated resources
+            Tuple of processed resources and total size of the kept content
         """
-        # Separate signature sets for URLs and files
-        url_signatures = set()
-        file_signatures = set()
-        
-        # Deduplicate URLs
-        unique_urls = {}
-        for url, data in resources.get("urls", {}).items():
-            content = data.get("content", "")
-            
-            # Create a simple signature (first 100 chars)
-            if not content:
-                continue
+        urls_dict = resources.get("urls") or {}
+        files_dict = resources.get("files") or {}
+        stats = resources.setdefault("stats", {})
+        
+        limit = self.max_content_length if truncate else None
+        if limit is not None and _max_content_len(stats, urls_dict, files_dict) <= limit:
+            limit = None  # Nothing exceeds the limit
+        
+        # Nothing to change, so skip the traversal
+        if not deduplicate and limit is None:
+            content_size = sum(
+                len(data.get("content", "")) for data in chain(urls_dict.values(), files_dict.values())
+            )
+            return resources, content_size
+        
+        # Single index so content duplicated across URLs and files is caught too
+        lsh = None
+        seen = set()  # Digests of exact content, checked before the MinHash pass
+        if deduplicate:
+            lsh = _MinHashLSH(capacity=len(urls_dict) + len(files_dict))
+        
+        removed = {}
+        content_size = 0
+        for kind, items in (("urls", urls_dict), ("files", files_dict)):
+            kept = {}
+            for key, data in items.items():
+                content = data.get("content", "")
+                clipped = content[:limit]
                 
-            signature = content[:100].strip().lower()
-            signature = re.sub(r'\s+', ' ', signature)
-            
-            if signature not in url_signatures:
-                unique_urls[url] = data
-                url_signatures.add(signature)
-        
-        # Deduplicate files
-        unique_files = {}
-        for path, data in resources.get("files", {}).items():
-            content = data.get("content", "")
-            
-            # Create a simple signature
-            if not content:
-                continue
+                if lsh is not None:
+                    if not content:
+                        continue
+                    digest = hashlib.blake2b(clipped.encode('utf-8'), digest_size=8).digest()
+                    if digest in seen:
+                        continue
+                    seen.add(digest)
+
+                    signature = _signature(clipped)
+                    if lsh.query(signature):
+                        continue
+                    lsh.insert(key, signature)
                 
-            signature = content[:100].strip().lower()
-            signature = re.sub(r'\s+', ' ', signature)
-            
-            if signature not in file_signatures:
-                unique_files[path] = data
-                file_signatures.add(signature)
+                if len(clipped) < len(content):
+                    content = data["content"] = clipped + "... [content truncated]"
+                kept[key] = data
+                content_size += len(content)
+                
+            removed[kind] = len(items) - len(kept)
+            resources[kind] = kept
         
-        # Add deduplication statistics
-        urls_removed = len(resources.get("urls", {})) - len(unique_urls)
-        files_removed = len(resources.get("files", {})) - len(unique_files)
+        if deduplicate:
+            stats["duplicates_removed"] = removed["urls"] + removed["files"]
+            log.debug(f"Deduplication removed {removed['urls']} URL(s) and {removed['files']} file(s)")
         
-        # Update resources with deduplicated content
-        resources["urls"] = unique_urls
-        resources["files"] = unique_files
-        resources["stats"]["duplicates_removed"] = urls_removed + files_removed
+        return resources, content_size
+    
+    def _deduplicate_resources(self, resources: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Remove duplicate or very similar resources.
         
-        log.debug(f"Deduplication removed {urls_removed} URL(s) and {files_removed} file(s)")
+        Near-duplicates are detected with MinHash signatures bucketed by LSH,
+        so each resource is only compared against likely matches.
         
-        return resources
+        Args:
+            resources: Resources to deduplicate
+            
+        Returns:
+            Deduplicated resources
+        """
+        return self._postprocess(resources, deduplicate=True, truncate=False)[0]
     
     def _truncate_content(self, resources: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -218,19 +420,39 @@ class ResourceManager:
         Returns:
             Resources with truncated content
         """
-        # Truncate URL content
-        for url, data in resources.get("urls", {}).items():
-            content = data.get("content", "")
-            if len(content) > self.max_content_length:
-                data["content"] = content[:self.max_content_length] + "... [content truncated]"
-                
-        # Truncate file content
-        for path, data in resources.get("files", {}).items():
-            content = data.get("content", "")
-            if len(content) > self.max_content_length:
-                data["content"] = content[:self.max_content_length] + "... [content truncated]"
-                
-        return resources
+        return self._postprocess(resources, deduplicate=False, truncate=True)[0]
+
+
+# Missing-dependency warnings already emitted in this process
+_warned = set()
+
+
+@lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """
+    Check whether an optional module can be imported.
+    
+    The result is cached, so sys.path is only searched once per module.
+    
+    Args:
+        name: Top-level module name
+        
+    Returns:
+        True if the module is available
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+def _warn_once(message: str) -> None:
+    """
+    Log a warning the first time a given message is seen.
+    
+    Args:
+        message: Warning message
+    """
+    if message not in _warned:
+        _warned.add(message)
+        log.warning(message)
 
 
 class ResourceCollectionManager:
@@ -263,22 +485,22 @@ class ResourceCollectionManager:
         )
         
         # Check for optional dependencies for enhanced functionality
-        self.bs4_available = importlib.util.find_spec("bs4") is not None
-        self.markdown_available = importlib.util.find_spec("markdown") is not None
-        self.pandas_available = importlib.util.find_spec("pandas") is not None
-        self.pymupdf_available = importlib.util.find_spec("fitz") is not None
-        self.docx_available = importlib.util.find_spec("docx") is not None
+        self.bs4_available = _has_module("bs4")
+        self.markdown_available = _has_module("markdown")
+        self.pandas_available = _has_module("pandas")
+        self.pymupdf_available = _has_module("fitz")
+        self.docx_available = _has_module("docx")
         
         if not self.bs4_available:
-            log.warning("BeautifulSoup4 not available - HTML parsing will be limited")
+            _warn_once("BeautifulSoup4 not available - HTML parsing will be limited")
         if not self.markdown_available:
-            log.warning("Markdown library not available - Markdown processing will be basic")
+            _warn_once("Markdown library not available - Markdown processing will be basic")
         if not self.pandas_available:
-            log.warning("Pandas not available - Data file processing will be limited")
+            _warn_once("Pandas not available - Data file processing will be limited")
         if not self.pymupdf_available:
-            log.warning("PyMuPDF not available - PDF processing will not be available")
+            _warn_once("PyMuPDF not available - PDF processing will not be available")
         if not self.docx_available:
-            log.warning("python-docx not available - DOCX processing will not be available")
+            _warn_once("python-docx not available - DOCX processing will not be available")
         
     def collect_resources(
         self,
@@ -332,46 +554,22 @@ class ResourceCollectionManager:
         Returns:
             Formatted context string for prompt
         """
-        # Use enhanced context extraction if markdown is available
+        # Markdown-style output with linked keywords when markdown is available
         if self.markdown_available:
-            try:
-                import markdown
-                
-                # Extract most relevant content
-                context_parts = []
-                
-                # Include most relevant URL content
-                urls = list(resources.get("urls", {}).items())
-                if urls:
-                    context_parts.append("## Web Resources")
-                    for i, (url, data) in enumerate(urls[:max_items]):
-                        title = data.get("title", url)
-                        content = data.get("content", "")
-                        if len(content) > 500:
-                            content = content[:500] + "..."
-                        context_parts.append(f"### {title}\n{content}")
-                
-                # Include most relevant file content
-                files = list(resources.get("files", {}).items())
-                if files:
-                    context_parts.append("## Local Resources")
-                    for i, (path, data) in enumerate(files[:max_items]):
-                        title = data.get("title", Path(path).name)
-                        content = data.get("content", "")
-                        if len(content) > 500:
-                            content = content[:500] + "..."
-                        context_parts.append(f"### {title}\n{content}")
+            urls_dict = resources.get("urls") or {}
+            files_dict = resources.get("files") or {}
+            metadata = resources.get("metadata") or {}
+            
+            context_parts = []
+            context_parts.extend(_format_block("urls", urls_dict, max_items))
+            context_parts.extend(_format_block("files", files_dict, max_items))
+            
+            keywords = metadata.get("keywords") or []
+            if keywords:
+                keyword_links = [f"[{kw}](#{kw.replace(' ', '-')})" for kw in keywords[:20]]
+                context_parts.append(f"## Keywords\n{', '.join(keyword_links)}")
                 
-                # Include keywords as markdown
-                keywords = resources.get("metadata", {}).get("keywords", [])
-                if keywords:
-                    keyword_links = [f"[{kw}](#{kw.replace(' ', '-')})" for kw in keywords[:20]]
-                    context_parts.append(f"## Keywords\n{', '.join(keyword_links)}")
-                    
-                # Return markdown context
-                return "\n\n".join(context_parts)
-            except Exception as e:
-                log.warning(f"Error using markdown for context extraction: {e}")
+            return "\n\n".join(context_parts)
         
         # Fall back to basic context extraction
         return self.manager.extract_context(resources, topic, max_items)
@@ -59,12 +59,13 @@ class WebResourceCollector(CollectorABC):
             "total_content_size": 0
         }
     
-    def collect(self, urls: List[str]) -> Dict[str, Any]:
+    def collect(self, urls: List[str], extract_keywords: bool = True) -> Dict[str, Any]:
         """
         Collect resources from URLs concurrently.
         
         Args:
             urls: List of URLs to collect from
+            extract_keywords: Whether to extract keywords from content
             
         Returns:
             Dictionary of collected resources organized by URL
@@ -99,8 +100,9 @@ class WebResourceCollector(CollectorABC):
                             resources["metadata"]["sources"].append(domain)
                         
                         # Extract keywords
-                        keywords = self._extract_keywords(url_content.get("content", ""))
-                        resources["metadata"]["keywords"].extend(keywords)
+                        if extract_keywords:
+                            keywords = self._extract_keywords(url_content.get("content", ""))
+                            resources["metadata"]["keywords"].extend(keywords)
                 except Exception as e:
                     self.stats["urls_failed"] += 1
                     log.error(f"Failed to extract content from URL {url}: {e}")
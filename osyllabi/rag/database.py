@@ -9,17 +9,22 @@ import pandas as pd
 import sqlite3
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from osyllabi.utils.log import log
-from osyllabi.utils.vector.operations import cosine_similarity
+from osyllabi.utils.vector.operations import (
+    cosine_similarity, quantize_int8, int8_cosine_similarity, int8_row_norms
+)
 
 # Default table names
 DEFAULT_CHUNKS_TABLE = "chunks"
 DEFAULT_VECTORS_TABLE = "vectors"
 
+# Supported embedding storage formats
+QUANTIZATION_MODES = (None, "int8")
+
 
 class VectorDatabase:
     """
@@ -27,19 +32,33 @@ class VectorDatabase:
     Stores documents, chunks, and embeddings for quick access.
     """
 
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, quantization: Optional[str] = None):
         """
         Initialize database.
         
         Args:
             db_path: Optional path to database file (not used in in-memory implementation)
+            quantization: Embedding storage format; None keeps float32, "int8"
+                stores int8 codes with a per-vector scale
+                
+        Raises:
+            ValueError: If the quantization mode is not supported
         """
-        # Each row will contain: doc_id, chunk_id, text, source, metadata, embedding (np.array)
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization mode: {quantization}")
+        self.quantization = quantization
+        
+        # Each row will contain: doc_id, chunk_id, text, source, metadata,
+        # embedding (np.array) and scale (float, only set for int8 embeddings)
         self.data = pd.DataFrame(columns=[
-            "doc_id", "chunk_id", "text", "source", "metadata", "embedding"
+            "doc_id", "chunk_id", "text", "source", "metadata", "embedding", "scale"
         ])
         self._doc_counter = 0
         self._chunk_counter = 0
+        # Contiguous copy of the embedding column and its row norms, rebuilt
+        # lazily after writes
+        self._matrix: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
         # Store path for potential future persistence
         self.db_path = db_path
 
@@ -58,31 +77,56 @@ class VectorDatabase:
         self._doc_counter += 1
         chunk_ids = []
 
-        for i, (chunk, vec) in enumerate(zip(text_chunks, vectors)):
+        if self.quantization == "int8" and len(vectors) > 0:
+            embeddings, scales = quantize_int8(vectors)
+            scales = scales[:, 0].tolist()
+        else:
+            embeddings = [np.array(vec, dtype=np.float32) for vec in vectors]
+            scales = [None] * len(embeddings)
+
+        # Chunks without a source are never deduplicated
+        dedup = dedup and source is not None
+        
+        # Map existing chunk texts for this source to their ids in one pass
+        existing = {}
+        if dedup and not self.data.empty:
+            matches = self.data[self.data["source"] == source]
+            existing = dict(zip(matches["text"], matches["chunk_id"].astype(int)))
+
+        rows = []
+        for chunk, vec, scale in zip(text_chunks, embeddings, scales):
             if not chunk.strip():
                 continue
             chunk_id = self._chunk_counter
             self._chunk_counter += 1
 
             # Check dedup
-            if dedup:
-                existing = self.data[
-                    (self.data["text"] == chunk) & (self.data["source"] == source)
-                ]
-                if len(existing) > 0:
-                    chunk_ids.append(int(existing.iloc[0]["chunk_id"]))
-                    continue
-
-            row = {
+            if dedup and chunk in existing:
+                chunk_ids.append(existing[chunk])
+                continue
+
+            rows.append({
                 "doc_id": doc_id,
                 "chunk_id": chunk_id,
                 "text": chunk,
                 "source": source if source else "",
                 "metadata": json.dumps(metadata) if metadata else None,
-                "embedding": np.array(vec, dtype=np.float32)
-            }
-            self.data = pd.concat([self.data, pd.DataFrame([row])], ignore_index=True)
+                "embedding": vec,
+                "scale": scale
+            })
+            existing[chunk] = chunk_id
             chunk_ids.append(chunk_id)
+
+        # Append all new rows at once instead of copying the frame per chunk
+        if rows:
+            new_rows = pd.DataFrame(rows, columns=self.data.columns)
+            if self.data.empty:
+                # Concatenating onto the empty object-typed frame is deprecated
+                self.data = new_rows
+            else:
+                self.data = pd.concat([self.data, new_rows], ignore_index=True)
+            self._matrix = None
+            self._norms = None
         return chunk_ids
 
     def remove_document(self, source: str) -> None:
@@ -90,6 +134,35 @@ class VectorDatabase:
         if len(doc_rows) > 0:
             doc_ids = doc_rows["doc_id"].unique()
             self.data = self.data[~self.data["doc_id"].isin(doc_ids)]
+            self._matrix = None
+            self._norms = None
+
+    def _embedding_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get all stored embeddings as one contiguous matrix with its row norms.
+        
+        Both are built on the first search after a write and reused by later
+        searches, so retrieval does not restack embeddings or recompute norms.
+        
+        Returns:
+            Tuple of (matrix with one embedding per row in frame order, row norms)
+        """
+        if self._matrix is None:
+            matrix = np.stack(self.data["embedding"].to_list())
+            if self.quantization == "int8":
+                self._norms = int8_row_norms(matrix)
+            else:
+                self._norms = np.linalg.norm(matrix, axis=1)
+            self._matrix = matrix
+        return self._matrix, self._norms
+
+    def clear(self) -> None:
+        """Remove all documents and chunks, keeping the database configuration."""
+        self.data = self.data.iloc[0:0]
+        self._doc_counter = 0
+        self._chunk_counter = 0
+        self._matrix = None
+        self._norms = None
 
     def get_document_sources(self) -> List[str]:
         return list(self.data["source"].dropna().unique())
@@ -103,26 +176,25 @@ class VectorDatabase:
     ) -> List[Dict[str, Any]]:
         if isinstance(source_filter, str):
             source_filter = [source_filter]
-        df = self.data.copy()
-        if source_filter:
-            df = df[df["source"].isin(source_filter)]
-        if df.empty:
+        if self.data.empty:
             return []
 
-        qvec = np.array(query_vector, dtype=np.float32)
-        embeddings = df["embedding"].to_list()
+        matrix, row_norms = self._embedding_matrix()
+        if self.quantization == "int8":
+            query_codes, _ = quantize_int8(query_vector)
+            sims = int8_cosine_similarity(query_codes, matrix, row_norms)
+        else:
+            qvec = np.array(query_vector, dtype=np.float32)
+            sims = matrix @ qvec / (row_norms * np.linalg.norm(qvec) + 1e-8)
 
-        # Cosine similarity
-        sims = []
-        for emb in embeddings:
-            dot = np.dot(qvec, emb)
-            norm_prod = np.linalg.norm(qvec) * np.linalg.norm(emb)
-            similarity = float(dot / (norm_prod + 1e-8))
-            sims.append(similarity)
+        # Rank only the rows that pass the filter and threshold
+        keep = sims >= threshold
+        if source_filter:
+            keep &= self.data["source"].isin(source_filter).to_numpy()
+        candidates = np.flatnonzero(keep)
+        top = candidates[np.argsort(-sims[candidates], kind="stable")[:top_k]]
 
-        df["similarity"] = sims
-        df = df[df["similarity"] >= threshold]
-        df = df.sort_values("similarity", ascending=False).head(top_k)
+        df = self.data.iloc[top].assign(similarity=sims[top])
 
         results = []
         for _, row in df.iterrows():
@@ -146,5 +218,6 @@ class VectorDatabase:
         }
 
     def close(self) -> None:
-        # No-op for in-memory
-        pass
+        """Release the cached search matrix; stored chunks stay in memory."""
+        self._matrix = None
+        self._norms = None
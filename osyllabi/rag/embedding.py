@@ -3,7 +3,9 @@ Embedding generation for vector representations of text.
 """
 import time
 import asyncio
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Dict, List, TypeVar
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
@@ -12,6 +14,9 @@ from osyllabi.utils.decorators.singleton import singleton
 from osyllabi.utils.utils import check_for_ollama
 from osyllabi.utils.log import log
 
+# Type variable for generic return type annotations
+T = TypeVar('T')
+
 @singleton
 class EmbeddingGenerator:
     """
@@ -51,17 +56,14 @@ class EmbeddingGenerator:
         self._cache_hits = 0
         self._cache_misses = 0
         
+        # Private loop for the synchronous methods; it is never made the thread's
+        # current loop, so callers' own loops are left alone
+        self._loop = asyncio.new_event_loop()
+        self._loop_lock = threading.Lock()
+        
         # Verify model exists and can generate embeddings
         try:
-            # Create an event loop if one doesn't exist
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-            # Test embedding generation
-            loop.run_until_complete(self._test_embedding())
+            self._run_sync(self._test_embedding())
             log.info(f"Successfully connected to Ollama embedding API with model {self.model_name}")
         except Exception as e:
             log.error(f"Failed to generate embeddings with model {self.model_name}: {e}")
@@ -73,11 +75,57 @@ class EmbeddingGenerator:
         self._embedding_dim = len(embedding)
         log.debug(f"Embedding dimension: {self._embedding_dim}")
         
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4), retry=retry_if_exception_type(Exception))
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        Coroutines run on the generator's private loop, so the client's
+        connection pool is reused between calls. When the caller is already
+        inside a running loop, the private loop is driven from a worker thread
+        instead of blocking on the caller's loop.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._run_on_private_loop(coro)
+            
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(self._run_on_private_loop, coro).result()
+            
+    def _run_on_private_loop(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the private loop, one caller at a time."""
+        with self._loop_lock:
+            return self._loop.run_until_complete(coro)
+        
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
         
+        Args:
+            texts: List of text strings to embed
+            
+        Returns:
+            List of embedding vectors
+            
+        Raises:
+            RuntimeError: If embedding generation fails
+        """
+        if not texts:
+            return []
+        
+        return self._run_sync(self.embed_texts_async(texts))
+    
+    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=4), retry=retry_if_exception_type(Exception))
+    async def embed_texts_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts from within a running event loop.
+        
         Args:
             texts: List of text strings to embed
             
@@ -109,32 +157,22 @@ class EmbeddingGenerator:
                     uncached_indices.append(i)
                     self._cache_misses += 1
         else:
+            result = [[] for _ in texts]
             uncached_texts = texts
             uncached_indices = list(range(len(texts)))
         
         # Generate embeddings for uncached texts
         if uncached_texts:
             try:
-                # Create an event loop if one doesn't exist
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                # Generate embeddings
-                embeddings = loop.run_until_complete(
-                    self.client.embed_batch(uncached_texts, model=self.model_name)
-                )
+                embeddings = await self.client.embed_batch(uncached_texts, model=self.model_name)
                 
                 # Update results and cache
-                for i, embedding in zip(uncached_indices, embeddings):
+                for text, i, embedding in zip(uncached_texts, uncached_indices, embeddings):
                     result[i] = embedding
                     
                     # Add to cache if enabled
-                    if self.cache_embeddings and uncached_texts[uncached_indices.index(i)]:
-                        cache_key = uncached_texts[uncached_indices.index(i)][:1000]
-                        self._embedding_cache[cache_key] = embedding
+                    if self.cache_embeddings and text:
+                        self._embedding_cache[text[:1000]] = embedding
                         
                         # Prune cache if it exceeds max size
                         if len(self._embedding_cache) > self.max_cache_size:
@@ -174,17 +212,8 @@ class EmbeddingGenerator:
             self._cache_misses += 1
             
         try:
-            # Create an event loop if one doesn't exist
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
             # Generate embedding
-            embedding = loop.run_until_complete(
-                self.client.embed(text, model=self.model_name)
-            )
+            embedding = self._run_sync(self.client.embed(text, model=self.model_name))
             
             # Add to cache if enabled
             if self.cache_embeddings:
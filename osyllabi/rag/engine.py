@@ -4,33 +4,53 @@ Retrieval-Augmented Generation engine for curriculum generation.
 This module provides the main RAG engine that coordinates vector storage,
 retrieval, and context assembly for curriculum generation.
 """
+import os
 import time
 import json
+import asyncio
+import hashlib
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 
 from osyllabi.utils.log import log
 from osyllabi.utils.utils import check_for_ollama
-from osyllabi.utils.decorators.singleton import singleton
+from osyllabi.utils.decorators.singleton import singleton, reset_singleton, release_singleton
 from osyllabi.rag.database import VectorDatabase
 from osyllabi.rag.embedding import EmbeddingGenerator
 from osyllabi.rag.chunking import TextChunker
+from osyllabi.rag.cache import Cache
 from osyllabi.rag.llama import LlamaDocumentLoader, setup_llama_index
 
-@singleton
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Number of chunks sent to the embedding API per request
+EMBED_BATCH_SIZE = 32
+
+# Maximum number of embedding batches in flight at once per document
+EMBED_MAX_IN_FLIGHT = 4
+
+# Number of query embeddings kept in the retrieval LRU cache
+QUERY_CACHE_SIZE = 512
+
+@singleton(key=lambda run_id=None, *args, **kwargs: run_id)
 class RAGEngine:
     """
     Retrieval-Augmented Generation engine for curriculum content.
     
     This class integrates document processing, embedding generation,
     vector storage, and retrieval to support RAG for curriculum generation.
+    One engine is kept per run ID, so repeated construction for the same run
+    reuses its database and embedding client.
     """
     
     @classmethod 
     def _reset_singleton(cls):
-        """Reset the singleton instance (for testing only)"""
-        if hasattr(cls, "_instance"):
-            delattr(cls, "_instance")
+        """Reset the singleton instances (for testing only)"""
+        reset_singleton(cls)
     
     def __init__(
         self,
@@ -39,7 +59,8 @@ class RAGEngine:
         embedding_model: str = "llama3.1:latest",
         chunk_size: int = 512,
         chunk_overlap: int = 50,
-        create_dirs: bool = True
+        create_dirs: bool = True,
+        quantization: Optional[str] = "int8"
     ):
         """
         Initialize the RAG engine.
@@ -51,6 +72,7 @@ class RAGEngine:
             chunk_size: Size of text chunks in tokens
             chunk_overlap: Overlap between consecutive chunks in tokens
             create_dirs: Whether to create directories if they don't exist
+            quantization: Embedding storage format ("int8" or None for float32)
             
         Raises:
             RuntimeError: If Ollama is not available
@@ -64,6 +86,7 @@ class RAGEngine:
             "embedding_model": embedding_model,  # Use the provided model directly
             "chunk_size": chunk_size,
             "chunk_overlap": chunk_overlap,
+            "quantization": quantization,
             "created_at": time.time()
         }
 
@@ -74,12 +97,13 @@ class RAGEngine:
 
         # Create components using config values
         db_path = self.vector_dir / "vector.db"
-        self.vector_db = VectorDatabase(db_path)
+        self.vector_db = VectorDatabase(db_path, quantization=self.config["quantization"])
         self.embedder = EmbeddingGenerator(model_name=self.config["embedding_model"])
         self.chunker = TextChunker(
             chunk_size=self.config["chunk_size"],
             overlap=self.config["chunk_overlap"]
         )
+        self._query_cache = Cache(max_size=QUERY_CACHE_SIZE)
         
         # Save config to disk if directories should be created
         if create_dirs:
@@ -99,11 +123,38 @@ class RAGEngine:
 
         
     def _save_config(self) -> None:
-        """Save RAG configuration to disk."""
+        """
+        Save RAG configuration to disk, skipping the write if unchanged.
+        
+        When the run already has a saved configuration, its original
+        created_at is kept so reconstructing an unchanged run does not rewrite
+        the file.
+        """
         self.vector_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
         config_path = self.vector_dir / "metadata.json"
-        with open(config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        
+        if config_path.exists():
+            try:
+                raw = config_path.read_bytes()
+                existing = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            except (OSError, ValueError):
+                existing = None
+                
+            if isinstance(existing, dict):
+                if "created_at" in existing:
+                    self.config["created_at"] = existing["created_at"]
+                if existing == self.config:
+                    return
+        
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.config, indent=2).encode('utf-8')
+        
+        # Write to a temporary file and swap it in atomically
+        tmp_path = config_path.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, config_path)
             
 
     def add_document(
@@ -164,6 +215,85 @@ class RAGEngine:
             raise RuntimeError(f"Failed to add document to database: {e}")
         
 
+    async def add_document_async(
+        self,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        source: Optional[str] = None,
+        batch_size: int = EMBED_BATCH_SIZE
+    ) -> int:
+        """
+        Process and add a document to the vector store with batched embedding.
+        
+        The document is chunked up front and its chunks are sent to the
+        embedding API in batches over the shared Ollama client, with at most
+        EMBED_MAX_IN_FLIGHT batches running concurrently. All chunks are stored
+        with a single database insert once every batch has been embedded.
+        
+        Args:
+            text: Document text content
+            metadata: Additional document metadata
+            source: Source identifier (file, URL, etc.)
+            batch_size: Number of chunks per embedding request
+            
+        Returns:
+            int: Number of chunks added to the database
+            
+        Raises:
+            RuntimeError: If vectorization or database operation fails
+        """
+        if not text or not text.strip():
+            log.debug("Skipping empty document")
+            return 0
+            
+        # Prepare metadata
+        doc_metadata = metadata or {}
+        if source:
+            doc_metadata['source'] = source
+        
+        chunks = self.chunker.chunk_text(text)
+        if not chunks:
+            log.debug("No chunks generated from document")
+            return 0
+            
+        batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+        
+        # Cap concurrent embedding requests so large documents don't flood the server
+        semaphore = asyncio.Semaphore(EMBED_MAX_IN_FLIGHT)
+        
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embedder.embed_texts_async(batch)
+                
+        tasks = [asyncio.ensure_future(embed_batch(batch)) for batch in batches]
+        
+        # Collect results in document order - will raise RuntimeError if Ollama is not available
+        embeddings = []
+        try:
+            for task in tasks:
+                embeddings.extend(await task)
+        except Exception as e:
+            for task in tasks:
+                task.cancel()
+            log.error(f"Failed to generate embeddings: {e}")
+            raise RuntimeError(f"Failed to generate embeddings for document: {e}")
+        
+        # Store in database
+        try:
+            self.vector_db.add_document(chunks, embeddings, doc_metadata, source=source)
+            
+            # Update document count
+            if hasattr(self, 'stats'):
+                self.stats["documents_added"] = self.stats.get("documents_added", 0) + 1
+                self.stats["chunks_added"] = self.stats.get("chunks_added", 0) + len(chunks)
+            
+            log.debug(f"Added document with {len(chunks)} chunks in {len(batches)} batch(es)")
+            return len(chunks)
+        except Exception as e:
+            log.error(f"Failed to add document to database: {e}")
+            raise RuntimeError(f"Failed to add document to database: {e}")
+        
+
     def retrieve(
         self, 
         query: str, 
@@ -188,12 +318,18 @@ class RAGEngine:
         """
         log.debug(f"Retrieving context for query: {query[:50]}{'...' if len(query) > 50 else ''}")
         
+        # Reuse the embedding of a recently seen query when possible
+        cache_key = hashlib.blake2b(query.encode('utf-8'), digest_size=16).hexdigest()
+        query_embedding = self._query_cache.get(cache_key)
+        
         # Generate query embedding - will raise RuntimeError if Ollama is not available
-        try:
-            query_embedding = self.embedder.embed_text(query)
-        except Exception as e:
-            log.error(f"Failed to generate embedding for query: {e}")
-            raise RuntimeError(f"Failed to generate embedding for query: {e}")
+        if query_embedding is None:
+            try:
+                query_embedding = self.embedder.embed_text(query)
+            except Exception as e:
+                log.error(f"Failed to generate embedding for query: {e}")
+                raise RuntimeError(f"Failed to generate embedding for query: {e}")
+            self._query_cache.set(cache_key, query_embedding)
         
         # Search for similar chunks
         try:
@@ -236,6 +372,23 @@ class RAGEngine:
         }
     
 
+    def close(self) -> None:
+        """
+        Close the vector database and release this engine's run ID.
+        
+        Constructing or loading the same run ID afterwards creates a new engine.
+        """
+        self.vector_db.close()
+        release_singleton(self)
+        
+    def __enter__(self) -> "RAGEngine":
+        """Use the engine as a context manager that closes it on exit."""
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the engine when leaving the context."""
+        self.close()
+
     def purge(self) -> None:
         """
         Remove all data from the vector database.
@@ -244,16 +397,11 @@ class RAGEngine:
         """
         log.warning(f"Purging all data from RAG engine {self.run_id}")
         
-        # Close current connection
-        self.vector_db.close()
-        
-        # Remove database file
-        db_path = self.vector_dir / "vector.db"
-        if db_path.exists():
-            db_path.unlink()
+        # Empty the existing database in place instead of recreating it
+        self.vector_db.clear()
         
-        # Recreate database
-        self.vector_db = VectorDatabase(db_path)
+        # Drop cached query embeddings along with the data
+        self._query_cache.clear()
         
         # Reset stats
         self.stats = {
@@ -303,14 +451,16 @@ class RAGEngine:
             with open(config_path, 'r') as f:
                 config = json.load(f)
                 
-            # Create new instance with loaded config
+            # Create new instance with loaded config; the saved config is
+            # unchanged, so metadata.json is not written back
             engine = cls(
                 run_id=config.get("run_id", run_id),  # Use config run_id if available
                 base_dir=base_dir,
                 embedding_model=config.get("embedding_model"),  # Use loaded model
                 chunk_size=config.get("chunk_size", 512),
                 chunk_overlap=config.get("chunk_overlap", 50),
-                create_dirs=create_dirs
+                create_dirs=create_dirs,
+                quantization=config.get("quantization")
             )
             return engine
         else:
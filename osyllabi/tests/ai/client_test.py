@@ -3,10 +3,33 @@ Unit tests for the Ollama API client.
 """
 import unittest
 import asyncio
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from unittest.mock import patch, AsyncMock
 
 from osyllabi.ai.client import OllamaClient
 from osyllabi.config import AI_CONFIG
+from osyllabi.utils.decorators.singleton import reset_singleton
+
+
+class _EmbeddingHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive stand-in for the Ollama embeddings endpoint."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"embedding": [1.0, 2.0]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, *args):
+        pass
+
 
 class TestOllamaClient(unittest.TestCase):
     """Test cases for the OllamaClient class."""
@@ -162,5 +185,44 @@ class TestOllamaClient(unittest.TestCase):
         self.assertTrue(kwargs["stream"])
 
 
+class TestOllamaClientEventLoops(unittest.TestCase):
+    """Test that the pooled HTTP client follows the running event loop."""
+    
+    def setUp(self):
+        """Start a local embeddings server and a fresh client pointing at it."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _EmbeddingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        
+        reset_singleton(OllamaClient)
+        self.client = OllamaClient(base_url=f"http://127.0.0.1:{self.server.server_port}")
+        
+    def tearDown(self):
+        """Stop the server and drop the test client."""
+        reset_singleton(OllamaClient)
+        self.server.shutdown()
+        self.server.server_close()
+        
+    def test_consecutive_asyncio_runs(self):
+        """Test that separate asyncio.run calls can share one client."""
+        # Go through the pooled client directly so embed()'s retry can't mask a failure
+        async def embed(text):
+            response = await self.client.client.embeddings(model="test-model", prompt=text)
+            return response["embedding"]
+            
+        self.assertEqual(asyncio.run(embed("first")), [1.0, 2.0])
+        self.assertEqual(asyncio.run(embed("second")), [1.0, 2.0])
+        
+    def test_client_reused_within_loop(self):
+        """Test that requests on the same loop share one pooled client."""
+        async def embed_twice():
+            await self.client.embed("first", model="test-model")
+            first_client = self.client.client
+            await self.client.embed("second", model="test-model")
+            return first_client, self.client.client
+            
+        first_client, second_client = asyncio.run(embed_twice())
+        self.assertIs(first_client, second_client)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -111,7 +111,7 @@ class TestResourceCollector(unittest.TestCase):
         result = self.collector.collect(urls, [])
         
         # Verify web collector was called correctly
-        self.mock_web_collector.collect.assert_called_once_with(urls)
+        self.mock_web_collector.collect.assert_called_once_with(urls, extract_keywords=True)
         self.mock_file_collector.collect.assert_not_called()
         
         # Verify results are processed correctly
@@ -137,7 +137,7 @@ class TestResourceCollector(unittest.TestCase):
         result = self.collector.collect([], paths)
         
         # Verify file collector was called correctly
-        self.mock_file_collector.collect.assert_called_once_with(paths)
+        self.mock_file_collector.collect.assert_called_once_with(paths, extract_keywords=True)
         self.mock_web_collector.collect.assert_not_called()
         
         # Verify results are processed correctly
@@ -175,8 +175,8 @@ class TestResourceCollector(unittest.TestCase):
         result = self.collector.collect(urls, paths)
         
         # Verify both collectors were called correctly
-        self.mock_web_collector.collect.assert_called_once_with(urls)
-        self.mock_file_collector.collect.assert_called_once_with(paths)
+        self.mock_web_collector.collect.assert_called_once_with(urls, extract_keywords=True)
+        self.mock_file_collector.collect.assert_called_once_with(paths, extract_keywords=True)
         
         # Verify results are processed correctly
         self.assertEqual(len(result["urls"]), 1)
@@ -189,6 +189,9 @@ class TestResourceCollector(unittest.TestCase):
         self.assertIn("file", result["metadata"]["keywords"])
         self.assertIn("test", result["metadata"]["keywords"])
         
+        # Longest content across both kinds is recorded for truncation
+        self.assertEqual(result["stats"]["max_content_len"], len("Example content"))
+        
     def test_success_rate_calculation(self):
         """Test success rate calculation."""
         # Configure mock collector responses with specific stats for this test
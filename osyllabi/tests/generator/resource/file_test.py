@@ -68,6 +68,40 @@ class TestFileResourceCollector(unittest.TestCase):
             # Clean up the temporary file
             os.unlink(temp_path)
 
+    def test_collect_without_keywords(self):
+        """Test that keywords are skipped while content stats are still recorded."""
+        import tempfile
+        from osyllabi.generator.resource.collector import ResourceCollector
+
+        content = "print('Hello keyword extraction')"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
+            temp_file.write(content)
+            temp_path = temp_file.name
+
+        try:
+            collector = FileResourceCollector(max_file_size_mb=1.0)
+            with patch.object(collector, '_extract_keywords') as mock_extract:
+                result = collector.collect([temp_path], extract_keywords=False)
+
+            mock_extract.assert_not_called()
+            self.assertEqual(result["metadata"]["keywords"], [])
+            self.assertEqual(result["stats"]["files_processed"], 1)
+
+            # The combined collector still records the longest content for truncation
+            resource_collector = ResourceCollector(max_file_size_mb=1.0)
+            with patch.object(resource_collector.file_collector, '_extract_keywords') as mock_extract:
+                resources = resource_collector.collect([], [temp_path], extract_keywords=False)
+
+            mock_extract.assert_not_called()
+            self.assertEqual(resources["metadata"]["keywords"], [])
+            self.assertEqual(
+                resources["stats"]["max_content_len"],
+                len(resources["files"][temp_path]["content"])
+            )
+            self.assertGreater(resources["stats"]["max_content_len"], 0)
+        finally:
+            os.unlink(temp_path)
+
     def test_collect_directory(self):
         """Test collecting from a directory."""
         import tempfile
@@ -6,6 +6,9 @@ from unittest.mock import patch, MagicMock, Mock
 from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
+
+from osyllabi.generator.resource import manager as manager_module
 from osyllabi.generator.resource.manager import ResourceManager
 
 
@@ -62,18 +65,35 @@ class TestResourceManager(unittest.TestCase):
         result = self.manager.process_sources(urls=urls, paths=paths)
         
         # Verify the collector was called with the right parameters
-        self.mock_collector.collect.assert_called_once_with(urls, paths)
+        self.mock_collector.collect.assert_called_once_with(urls, paths, extract_keywords=True)
         
         # Verify results
         self.assertEqual(len(result["urls"]), 1)
         self.assertEqual(len(result["files"]), 1)
         self.assertEqual(len(result["metadata"]["keywords"]), 3)
         
-        # Verify stats were updated
+        # Verify stats were updated; content size counts the content that was kept
         self.assertEqual(self.manager.stats["sources_processed"], 2)
-        self.assertEqual(self.manager.stats["total_content_size"], 25)
+        self.assertEqual(self.manager.stats["total_content_size"],
+                         len("Example content") + len("Test content"))
         self.assertEqual(self.manager.stats["keywords_extracted"], 3)
         
+    def test_process_sources_without_keywords(self):
+        """Test that disabling keyword extraction is passed to the collector."""
+        self.mock_collector.collect.return_value = {
+            "urls": {},
+            "files": {},
+            "metadata": {"keywords": [], "sources": []},
+            "stats": {}
+        }
+        
+        self.manager.process_sources(urls=["http://example.com"], extract_keywords=False)
+        
+        self.mock_collector.collect.assert_called_once_with(
+            ["http://example.com"], [], extract_keywords=False
+        )
+        self.assertEqual(self.manager.stats["keywords_extracted"], 0)
+        
     def test_process_sources_with_empty_inputs(self):
         """Test processing sources with empty inputs."""
         # Configure mock collector response
@@ -88,7 +108,7 @@ class TestResourceManager(unittest.TestCase):
         result = self.manager.process_sources(urls=[], paths=[])
         
         # Verify the collector was called with empty lists
-        self.mock_collector.collect.assert_called_once_with([], [])
+        self.mock_collector.collect.assert_called_once_with([], [], extract_keywords=True)
         
         # Verify results
         self.assertEqual(len(result["urls"]), 0)
@@ -128,7 +148,60 @@ class TestResourceManager(unittest.TestCase):
         self.assertIn("http://example.com/3", result["urls"])  # Unique content
         self.assertNotIn("http://example.com/2", result["urls"])  # Duplicate should be removed
         self.assertEqual(len(result["files"]), 1)  # Only unique file content should remain
+
+    def test_near_duplicate_detection(self):
+        """Test that content differing only in boilerplate is deduplicated."""
+        body = " ".join(f"Paragraph {i} explains spiking neurons and synapses." for i in range(40))
+        resources = {
+            "urls": {
+                "http://example.com/a": {"title": "A", "content": "Header A | Home\n" + body},
+                "http://example.com/b": {"title": "B", "content": "Site B :: Docs\n" + body},
+                "http://example.com/c": {"title": "C", "content": "An unrelated page about gardening tools."}
+            },
+            "files": {},
+            "metadata": {"keywords": [], "sources": []},
+            "stats": {}
+        }
+
+        result = self.manager._deduplicate_resources(resources)
+
+        self.assertIn("http://example.com/a", result["urls"])
+        self.assertNotIn("http://example.com/b", result["urls"])
+        self.assertIn("http://example.com/c", result["urls"])
+        self.assertEqual(result["stats"]["duplicates_removed"], 1)
+
+    def test_shingle_hashes_match_rolling_hash(self):
+        """Test that vectorized shingle hashes equal a sequential rolling hash."""
+        text = "rolling hashes slide over text"
+        size = manager_module.SHINGLE_SIZE
+        base = manager_module.ROLLING_BASE
+        mask = (1 << 64) - 1
+        
+        expected = set()
+        data = text.encode('utf-8')
+        high = pow(base, size - 1, 1 << 64)
+        value = 0
+        for i, byte in enumerate(data):
+            if i >= size:
+                value = (value - data[i - size] * high) & mask
+            value = (value * base + byte) & mask
+            if i >= size - 1:
+                expected.add(value >> 32)
+                
+        hashes = manager_module._shingle_hashes(text)
+        self.assertEqual(set(hashes.tolist()), expected)
+
+    def test_signature_blocks_match_full_broadcast(self):
+        """Test that the blocked signature equals the one-shot broadcast result."""
+        text = " ".join(f"token{i} appears in a long document" for i in range(200))
+        hashes = manager_module._shingle_hashes(text)
+        self.assertGreater(hashes.size, manager_module.SIGNATURE_BLOCK)
+        
+        expected = ((hashes[:, None] * manager_module._PERM_A + manager_module._PERM_B)
+                    % manager_module._MERSENNE_61).astype(np.uint32).min(axis=0)
         
+        np.testing.assert_array_equal(manager_module._signature(text), expected)
+
     def test_content_truncation(self):
         """Test truncation of long content."""
         # Create a simpler test that directly tests the truncation method
@@ -164,6 +237,72 @@ class TestResourceManager(unittest.TestCase):
         self.assertLessEqual(len(truncated["files"]["long_file.txt"]["content"]),
                             self.manager.max_content_length + len("... [content truncated]"))
         
+    def test_truncation_skipped_when_content_is_short(self):
+        """Test that truncation leaves resources untouched when nothing is too long."""
+        urls = {"http://example.com": {"title": "Example", "content": "short"}}
+        files = {"notes.txt": {"title": "Notes", "content": "also short"}}
+        resources = {
+            "urls": urls,
+            "files": files,
+            "metadata": {"keywords": [], "sources": []},
+            "stats": {"max_content_len": 10}
+        }
+        
+        result, content_size = self.manager._postprocess(resources, deduplicate=False)
+        
+        # The original dictionaries are returned as-is rather than rebuilt
+        self.assertIs(result["urls"], urls)
+        self.assertIs(result["files"], files)
+        self.assertEqual(content_size, len("short") + len("also short"))
+
+    def test_postprocess_deduplicates_truncated_content(self):
+        """Test that dedup and truncation happen together on clipped content."""
+        self.manager.max_content_length = 100
+        shared = "shared prefix text " * 10
+        resources = {
+            "urls": {
+                "http://example.com/1": {"title": "One", "content": shared + "tail one"},
+                "http://example.com/2": {"title": "Two", "content": shared + "a different tail"}
+            },
+            "files": {
+                "short.txt": {"title": "Short", "content": "A short unique file"}
+            },
+            "metadata": {"keywords": [], "sources": []},
+            "stats": {}
+        }
+
+        result, content_size = self.manager._postprocess(resources)
+
+        # Identical within the first 100 chars, so the second URL is a duplicate
+        self.assertEqual(list(result["urls"]), ["http://example.com/1"])
+        self.assertTrue(result["urls"]["http://example.com/1"]["content"].endswith("[content truncated]"))
+        self.assertEqual(result["files"]["short.txt"]["content"], "A short unique file")
+        self.assertEqual(result["stats"]["duplicates_removed"], 1)
+        self.assertEqual(content_size, sum(
+            len(data["content"]) for kind in ("urls", "files") for data in result[kind].values()
+        ))
+
+    def test_exact_duplicates_skip_signature(self):
+        """Test that exact copies are rejected without computing a MinHash signature."""
+        resources = {
+            "urls": {
+                "http://example.com/1": {"title": "One", "content": "Identical page body"},
+                "http://example.com/2": {"title": "Two", "content": "Identical page body"},
+                "http://example.com/3": {"title": "Three", "content": "Identical page body"}
+            },
+            "files": {},
+            "metadata": {"keywords": [], "sources": []},
+            "stats": {}
+        }
+
+        with patch('osyllabi.generator.resource.manager._signature',
+                   wraps=manager_module._signature) as mock_signature:
+            result, _ = self.manager._postprocess(resources)
+
+        self.assertEqual(list(result["urls"]), ["http://example.com/1"])
+        self.assertEqual(mock_signature.call_count, 1)
+        self.assertEqual(result["stats"]["duplicates_removed"], 2)
+
     def test_extract_context(self):
         """Test context extraction for prompts."""
         # Create sample resources
@@ -195,6 +334,38 @@ class TestResourceManager(unittest.TestCase):
         self.assertIn("file", context)
         self.assertIn("content", context)
         
+    def test_extract_context_snippets(self):
+        """Test that long content is clipped to a snippet in the context."""
+        resources = {
+            "urls": {"http://example.com": {"title": "Example", "content": "a" * 600}},
+            "files": {"notes/short.txt": {"content": "short"}},
+            "metadata": {"keywords": []},
+            "stats": {}
+        }
+
+        context = self.manager.extract_context(resources, "Test Topic")
+
+        self.assertIn("### Example\n" + "a" * 500 + "...\n", context)
+        self.assertIn("### short.txt\nshort\n", context)
+        self.assertNotIn("short...", context)
+
+    def test_extract_context_respects_max_items(self):
+        """Test that only the first max_items resources of each kind are included."""
+        resources = {
+            "urls": {f"http://example.com/{i}": {"title": f"Page {i}", "content": "body"} for i in range(50)},
+            "files": {},
+            "metadata": {"keywords": []},
+            "stats": {}
+        }
+
+        context = self.manager.extract_context(resources, "Test Topic", max_items=2)
+
+        self.assertEqual(context.count("### "), 2)
+        self.assertIn("Page 0", context)
+        self.assertIn("Page 1", context)
+        self.assertNotIn("Page 2", context)
+        self.assertNotIn("Local Resources", context)
+
     def test_get_stats(self):
         """Test retrieving manager statistics."""
         # Set up some stats
@@ -82,6 +82,22 @@ class TestWebResourceCollector(unittest.TestCase):
         self.assertEqual(result["urls"][url]["title"], expected_data["title"])
         self.assertIn(expected_data["domain"], result["metadata"]["sources"])
         
+    @patch('osyllabi.generator.resource.web.requests.get')
+    def test_collect_without_keywords(self, mock_get):
+        """Test that keyword extraction is skipped when disabled."""
+        mock_response = MagicMock(spec=requests.Response)
+        mock_response.text = "<html><head><title>Mocked Page</title></head><body>Mocked content</body></html>"
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.url = "http://example.com"
+        mock_get.return_value = mock_response
+        
+        with patch.object(self.collector, '_extract_keywords') as mock_extract:
+            result = self.collector.collect(["http://example.com"], extract_keywords=False)
+            
+        mock_extract.assert_not_called()
+        self.assertIn("http://example.com", result["urls"])
+        self.assertEqual(result["metadata"]["keywords"], [])
+        
     @patch('osyllabi.generator.resource.web.requests.get')
     def test_extract_url_content_html(self, mock_get):
         """Test extracting content from an HTML URL."""
@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock, Mock
 from pathlib import Path
 
 from osyllabi.generator.resource import ResourceCollectionManager
+from osyllabi.generator.resource import manager as manager_module
 
 
 class TestResourceCollectionManager(unittest.TestCase):
@@ -36,6 +37,23 @@ class TestResourceCollectionManager(unittest.TestCase):
         self.assertIsInstance(self.manager.pymupdf_available, bool)
         self.assertIsInstance(self.manager.docx_available, bool)
         
+    def test_dependency_probes_cached(self):
+        """Test that optional dependency probes run once across instances."""
+        manager_module._has_module.cache_clear()
+        manager_module._warned.clear()
+        
+        with patch('osyllabi.generator.resource.manager.importlib.util.find_spec',
+                   return_value=None) as mock_find_spec, \
+             patch('osyllabi.generator.resource.manager.log') as mock_log:
+            ResourceCollectionManager()
+            ResourceCollectionManager()
+            
+        manager_module._has_module.cache_clear()
+        
+        # Five probes and five warnings for the first instance only
+        self.assertEqual(mock_find_spec.call_count, 5)
+        self.assertEqual(mock_log.warning.call_count, 5)
+        
     def test_collect_resources(self):
         """Test collecting resources."""
         # Configure mock resource manager
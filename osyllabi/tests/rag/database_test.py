@@ -31,6 +31,20 @@ class TestVectorDatabase(unittest.TestCase):
         chunk_ids = self.db.add_document(chunks, vectors, {}, source="doc.txt")
         self.assertEqual(len(chunk_ids), 2)
 
+    def test_add_document_dedup(self):
+        first = self.db.add_document(["Same", "Other"], [[0.1, 0.2], [0.3, 0.4]], {}, source="doc.txt")
+        second = self.db.add_document(["Same", "Same", "New"], [[0.1, 0.2]] * 3, {}, source="doc.txt")
+        self.assertEqual(second[0], first[0])
+        self.assertEqual(second[1], first[0])
+        self.assertEqual(len(self.db.data), 3)
+
+    def test_add_document_without_source_not_deduplicated(self):
+        first = self.db.add_document(["Same"], [[0.1, 0.2]], {})
+        second = self.db.add_document(["Same", "Same"], [[0.1, 0.2]] * 2, {})
+        self.assertNotIn(first[0], second)
+        self.assertEqual(len(set(second)), 2)
+        self.assertEqual(len(self.db.data), 3)
+
     def test_get_document_sources(self):
         self.db.add_document(["Sample"], [[0.1, 0.2]], {}, "docA.txt")
         self.db.add_document(["Another"], [[0.3, 0.4]], {}, "docB.txt")
@@ -50,6 +64,15 @@ class TestVectorDatabase(unittest.TestCase):
         self.db.remove_document("test_doc.txt")
         self.assertEqual(len(self.db.data), 0)
 
+    def test_clear(self):
+        self.db.add_document(["Text 1", "Text 2"], [[0.1, 0.2], [0.3, 0.4]], {}, "doc.txt")
+        self.db.search([0.1, 0.2])
+        self.db.clear()
+        self.assertEqual(len(self.db.data), 0)
+        self.assertEqual(self.db.search([0.1, 0.2]), [])
+        chunk_ids = self.db.add_document(["Text 3"], [[0.5, 0.6]], {}, "doc.txt")
+        self.assertEqual(chunk_ids, [0])
+
     def test_search(self):
         self.db.add_document(["Text A", "Text B"], [[0.0, 1.0], [0.8, 0.1]], {}, "doc.txt")
         results = self.db.search([0.0, 1.0], top_k=1)
@@ -70,6 +93,35 @@ class TestVectorDatabase(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertIn("T1", results[0]["text"])
 
+    def test_search_int8_quantization(self):
+        db = VectorDatabase(quantization="int8")
+        db.add_document(["T1", "T2"], [[1.0, 0.0], [0.2, 0.9]], {}, "doc.txt")
+        self.assertEqual(db.data["embedding"].iloc[0].dtype, np.int8)
+        results = db.search([0.9, 0.1], top_k=1)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["text"], "T1")
+        self.assertGreater(results[0]["similarity"], 0.9)
+
+    def test_search_reuses_embedding_matrix(self):
+        self.db.add_document(["T1"], [[1.0, 0.0]], {}, "doc.txt")
+        self.db.search([1.0, 0.0])
+        matrix = self.db._matrix
+        self.db.search([0.0, 1.0])
+        self.assertIs(self.db._matrix, matrix)
+
+        # Writes invalidate the cached matrix
+        self.db.add_document(["T2"], [[0.0, 1.0]], {}, "doc2.txt")
+        results = self.db.search([0.0, 1.0], top_k=1)
+        self.assertEqual(results[0]["text"], "T2")
+        self.assertEqual(self.db._matrix.shape, (2, 2))
+        self.db.remove_document("doc2.txt")
+        results = self.db.search([0.0, 1.0], top_k=1)
+        self.assertEqual(results[0]["text"], "T1")
+
+    def test_invalid_quantization(self):
+        with self.assertRaises(ValueError):
+            VectorDatabase(quantization="fp4")
+
     def test_close_and_reopen(self):
         self.db.add_document(["CloseTest"], [[0.5, 0.5]], {}, "close_doc.txt")
         self.db.close()
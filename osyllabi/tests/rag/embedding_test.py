@@ -3,11 +3,17 @@ Unit tests for the EmbeddingGenerator class.
 """
 import unittest
 import asyncio
+import json
+import threading
 import warnings
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from unittest.mock import patch, AsyncMock, MagicMock
 
+from tenacity import wait_none
+
 from osyllabi.rag.embedding import EmbeddingGenerator
 from osyllabi.ai.client import OllamaClient
+from osyllabi.utils.decorators.singleton import reset_singleton
 
 # Filter out the NumPy deprecation warning from FAISS
 warnings.filterwarnings(
@@ -16,6 +22,31 @@ warnings.filterwarnings(
     category=DeprecationWarning
 )
 
+
+class _EmbeddingHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive stand-in for the Ollama embedding endpoints."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path == "/api/embed":
+            texts = request["input"] if isinstance(request["input"], list) else [request["input"]]
+            response = {"model": request["model"], "embeddings": [[float(len(text)), 1.0] for text in texts]}
+        else:
+            response = {"embedding": [float(len(request["prompt"])), 1.0]}
+            
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        
+    def log_message(self, *args):
+        pass
+
+
 class TestEmbeddingGenerator(unittest.TestCase):
     """Test cases for the EmbeddingGenerator class."""
     
@@ -227,5 +258,68 @@ class TestEmbeddingGenerator(unittest.TestCase):
         self.assertEqual(stats["misses"], 3)  # 3 cache misses (for unique texts)
         self.assertGreater(stats["hit_rate"], 0)
 
+
+class TestEmbeddingGeneratorEventLoops(unittest.TestCase):
+    """Test the real embedding path against a local stand-in server."""
+    
+    def setUp(self):
+        """Start the server and point a fresh Ollama client at it."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _EmbeddingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        
+        reset_singleton(OllamaClient)
+        reset_singleton(EmbeddingGenerator)
+        OllamaClient(base_url=f"http://127.0.0.1:{self.server.server_port}")
+        
+        patcher = patch('osyllabi.rag.embedding.check_for_ollama')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+    def tearDown(self):
+        """Stop the server and drop the test singletons."""
+        reset_singleton(EmbeddingGenerator)
+        reset_singleton(OllamaClient)
+        self.server.shutdown()
+        self.server.server_close()
+        
+    def test_embed_texts_async_under_asyncio_run(self):
+        """Test that a constructed generator works from separate asyncio.run calls."""
+        generator = EmbeddingGenerator(model_name="test-model", cache_embeddings=False)
+        self.assertEqual(generator.get_embedding_dimension(), 2)
+        
+        first = asyncio.run(generator.embed_texts_async(["a", "bb"]))
+        second = asyncio.run(generator.embed_texts_async(["ccc"]))
+        
+        self.assertEqual(first, [[1.0, 1.0], [2.0, 1.0]])
+        self.assertEqual(second, [[3.0, 1.0]])
+        self.assertEqual(generator.embed_texts(["dddd"]), [[4.0, 1.0]])
+        
+    def test_construct_inside_running_loop(self):
+        """Test that the generator can be built and used from a coroutine."""
+        async def build_and_embed():
+            generator = EmbeddingGenerator(model_name="test-model", cache_embeddings=False)
+            return await generator.embed_texts_async(["a"]), generator.embed_text("bb")
+            
+        batch, single = asyncio.run(build_and_embed())
+        
+        self.assertEqual(batch, [[1.0, 1.0]])
+        self.assertEqual(single, [2.0, 1.0])
+        
+    def test_embed_texts_async_retries(self):
+        """Test that a failed batch is retried once before giving up."""
+        generator = EmbeddingGenerator(model_name="test-model", cache_embeddings=False)
+        generator.client = MagicMock()
+        generator.client.embed_batch = AsyncMock(side_effect=[
+            RuntimeError("connection reset"),
+            [[0.5, 0.5]]
+        ])
+        
+        with patch.object(EmbeddingGenerator.embed_texts_async.retry, 'wait', wait_none()):
+            result = asyncio.run(generator.embed_texts_async(["a"]))
+            
+        self.assertEqual(result, [[0.5, 0.5]])
+        self.assertEqual(generator.client.embed_batch.await_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
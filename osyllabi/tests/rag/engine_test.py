@@ -2,12 +2,13 @@
 Unit tests for the RAGEngine class.
 """
 import unittest
+import asyncio
 import json
 import tempfile
 import warnings
 import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
 
 from osyllabi.rag.engine import RAGEngine
 from osyllabi.rag.database import VectorDatabase
@@ -150,6 +151,58 @@ class TestRAGEngine(unittest.TestCase):
             
             # Test passes without needing to check file operations
 
+    def test_save_config_skips_unchanged(self):
+        """Test that config is written atomically and not rewritten when unchanged."""
+        with patch.object(RAGEngine, '__init__', return_value=None):
+            engine = RAGEngine.__new__(RAGEngine)
+            engine.vector_dir = self.base_dir / "test-run" / "vectors"
+            engine.config = {"run_id": "test-run", "chunk_size": 256}
+            
+            # First save writes the file
+            engine._save_config()
+            config_path = engine.vector_dir / "metadata.json"
+            self.assertEqual(json.loads(config_path.read_text())["chunk_size"], 256)
+            self.assertFalse(config_path.with_suffix('.tmp').exists())
+            
+            # Saving identical config does not touch the file
+            with patch('osyllabi.rag.engine.os.replace') as mock_replace:
+                engine._save_config()
+                mock_replace.assert_not_called()
+            
+            # Changed config is written again
+            engine.config["chunk_size"] = 128
+            engine._save_config()
+            self.assertEqual(json.loads(config_path.read_text())["chunk_size"], 128)
+
+    def test_save_config_keeps_created_at(self):
+        """Test that re-creating a run keeps its saved created_at and skips the write."""
+        with patch.object(RAGEngine, '__init__', return_value=None):
+            engine = RAGEngine.__new__(RAGEngine)
+            engine.vector_dir = self.base_dir / "test-run" / "vectors"
+            engine.config = {"run_id": "test-run", "chunk_size": 256, "created_at": 100.0}
+            engine._save_config()
+            
+            # A new engine for the same run gets a fresh timestamp in __init__
+            engine.config = {"run_id": "test-run", "chunk_size": 256, "created_at": 200.0}
+            with patch('osyllabi.rag.engine.os.replace') as mock_replace:
+                engine._save_config()
+                mock_replace.assert_not_called()
+                
+            self.assertEqual(engine.config["created_at"], 100.0)
+
+    def test_save_config_without_orjson(self):
+        """Test that config is saved with the stdlib json fallback."""
+        with patch.object(RAGEngine, '__init__', return_value=None), \
+             patch('osyllabi.rag.engine.ORJSON_AVAILABLE', False):
+            engine = RAGEngine.__new__(RAGEngine)
+            engine.vector_dir = self.base_dir / "test-run" / "vectors"
+            engine.config = {"run_id": "test-run", "quantization": None}
+            
+            engine._save_config()
+            
+            config_path = engine.vector_dir / "metadata.json"
+            self.assertEqual(json.loads(config_path.read_text()), engine.config)
+
     @patch('osyllabi.rag.engine.VectorDatabase')
     @patch('osyllabi.rag.engine.EmbeddingGenerator')
     @patch('osyllabi.rag.engine.TextChunker')
@@ -201,6 +254,89 @@ class TestRAGEngine(unittest.TestCase):
         # Verify result
         self.assertEqual(result, 2)  # Number of chunks
     
+    @patch('osyllabi.rag.engine.VectorDatabase')
+    @patch('osyllabi.rag.engine.EmbeddingGenerator')
+    @patch('osyllabi.rag.engine.TextChunker')
+    @patch('osyllabi.rag.engine.check_for_ollama')
+    def test_add_document_async(self, mock_check_ollama, mock_chunker_class, mock_embedding_class, mock_db_class):
+        """Test adding a document with batched async embedding."""
+        mock_check_ollama.return_value = True
+        
+        # Initialize engine
+        engine = RAGEngine(
+            run_id="test-run",
+            base_dir=self.base_dir,
+            create_dirs=False
+        )
+        
+        mock_db = MagicMock()
+        engine.vector_db = mock_db
+        
+        mock_embedder = MagicMock()
+        mock_embedder.embed_texts_async = AsyncMock(
+            side_effect=lambda batch: [[float(len(text))] for text in batch]
+        )
+        engine.embedder = mock_embedder
+        
+        mock_chunker = MagicMock()
+        mock_chunker.chunk_text.return_value = ["a", "bb", "ccc"]
+        engine.chunker = mock_chunker
+        
+        # Test adding document in batches of two chunks
+        result = asyncio.run(engine.add_document_async(
+            text="Test document content",
+            source="test_document.txt",
+            batch_size=2
+        ))
+        
+        # Verify batches were embedded and stored in document order
+        self.assertEqual(result, 3)
+        self.assertEqual(mock_embedder.embed_texts_async.await_count, 2)
+        mock_db.add_document.assert_called_once_with(
+            ["a", "bb", "ccc"],
+            [[1.0], [2.0], [3.0]],
+            {"source": "test_document.txt"},
+            source="test_document.txt"
+        )
+
+    
+    @patch('osyllabi.rag.engine.EMBED_MAX_IN_FLIGHT', 2)
+    @patch('osyllabi.rag.engine.VectorDatabase')
+    @patch('osyllabi.rag.engine.EmbeddingGenerator')
+    @patch('osyllabi.rag.engine.TextChunker')
+    @patch('osyllabi.rag.engine.check_for_ollama')
+    def test_add_document_async_limits_in_flight(self, mock_check_ollama, mock_chunker_class, mock_embedding_class, mock_db_class):
+        """Test that concurrent embedding batches are capped."""
+        mock_check_ollama.return_value = True
+        
+        engine = RAGEngine(
+            run_id="test-run",
+            base_dir=self.base_dir,
+            create_dirs=False
+        )
+        engine.vector_db = MagicMock()
+        
+        in_flight = 0
+        peak = 0
+        
+        async def embed(batch):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [[1.0] for _ in batch]
+            
+        engine.embedder = MagicMock()
+        engine.embedder.embed_texts_async = embed
+        engine.chunker = MagicMock()
+        engine.chunker.chunk_text.return_value = [str(i) for i in range(10)]
+        
+        result = asyncio.run(engine.add_document_async(text="Test", batch_size=1))
+        
+        self.assertEqual(result, 10)
+        self.assertEqual(peak, 2)
+    
     @patch('osyllabi.rag.engine.VectorDatabase')
     @patch('osyllabi.rag.engine.EmbeddingGenerator')
     @patch('osyllabi.rag.engine.TextChunker')
@@ -252,6 +388,41 @@ class TestRAGEngine(unittest.TestCase):
         self.assertEqual(results[0]["text"], "Result 1")
         self.assertEqual(results[1]["text"], "Result 2")
     
+    @patch('osyllabi.rag.engine.VectorDatabase')
+    @patch('osyllabi.rag.engine.EmbeddingGenerator')
+    @patch('osyllabi.rag.engine.TextChunker')
+    @patch('osyllabi.rag.engine.check_for_ollama')
+    def test_retrieve_caches_query_embedding(self, mock_check_ollama, mock_chunker_class, mock_embedding_class, mock_db_class):
+        """Test that repeated queries reuse the cached query embedding."""
+        mock_check_ollama.return_value = True
+        
+        # Initialize engine
+        engine = RAGEngine(
+            run_id="test-run",
+            base_dir=self.base_dir,
+            create_dirs=False
+        )
+        
+        mock_db = MagicMock()
+        mock_db.search.return_value = []
+        mock_embedder = MagicMock()
+        mock_embedder.embed_text.return_value = [0.1, 0.2, 0.3]
+        engine.vector_db = mock_db
+        engine.embedder = mock_embedder
+        engine._query_cache.clear()
+        
+        # Same query twice only embeds once
+        engine.retrieve("Cached query")
+        engine.retrieve("Cached query")
+        mock_embedder.embed_text.assert_called_once_with("Cached query")
+        self.assertEqual(mock_db.search.call_count, 2)
+        
+        # Purge invalidates the cache
+        engine.purge()
+        engine.vector_db = mock_db
+        engine.retrieve("Cached query")
+        self.assertEqual(mock_embedder.embed_text.call_count, 2)
+    
     @patch('osyllabi.rag.engine.VectorDatabase')
     @patch('osyllabi.rag.engine.EmbeddingGenerator')
     @patch('osyllabi.rag.engine.TextChunker')
@@ -305,6 +476,34 @@ class TestRAGEngine(unittest.TestCase):
         self.assertEqual(stats["created_at"], 1234567890)
         self.assertEqual(stats["query_count"], 42)
     
+    def test_context_manager_closes_database(self):
+        """Test that leaving the engine context closes the vector database."""
+        with patch.object(RAGEngine, '__init__', return_value=None):
+            engine = RAGEngine.__new__(RAGEngine)
+            engine.vector_db = MagicMock()
+            
+            with engine as entered:
+                self.assertIs(entered, engine)
+                engine.vector_db.close.assert_not_called()
+                
+            engine.vector_db.close.assert_called_once()
+
+    @patch('osyllabi.rag.engine.VectorDatabase')
+    @patch('osyllabi.rag.engine.EmbeddingGenerator')
+    @patch('osyllabi.rag.engine.TextChunker')
+    @patch('osyllabi.rag.engine.check_for_ollama')
+    def test_close_releases_run_id(self, mock_check_ollama, mock_chunker_class, mock_embedding_class, mock_db_class):
+        """Test that a closed engine is not returned for its run ID again."""
+        mock_check_ollama.return_value = True
+        
+        engine = RAGEngine(run_id="test-run", base_dir=self.base_dir, create_dirs=False)
+        self.assertIs(RAGEngine(run_id="test-run"), engine)
+        
+        engine.close()
+        
+        reopened = RAGEngine(run_id="test-run", base_dir=self.base_dir, create_dirs=False)
+        self.assertIsNot(reopened, engine)
+
     @patch('osyllabi.rag.engine.VectorDatabase')
     @patch('osyllabi.rag.engine.EmbeddingGenerator')
     @patch('osyllabi.rag.engine.TextChunker')
@@ -338,9 +537,11 @@ class TestRAGEngine(unittest.TestCase):
         
         engine.purge()
         
-        # Verify calls - should see one more DB creation after purge
-        old_db.close.assert_called_once()
-        self.assertEqual(mock_db_class.call_count, db_init_count + 1)
+        # Verify the database is cleared in place rather than recreated
+        old_db.clear.assert_called_once()
+        old_db.close.assert_not_called()
+        self.assertIs(engine.vector_db, old_db)
+        self.assertEqual(mock_db_class.call_count, db_init_count)
     
     @patch('osyllabi.rag.engine.check_for_ollama')
     @patch('osyllabi.rag.engine.VectorDatabase')
@@ -387,6 +588,19 @@ class TestRAGEngine(unittest.TestCase):
                 self.assertEqual(engine.config["chunk_size"], 128)
                 self.assertEqual(engine.config["chunk_overlap"], 10)
 
+    @patch('osyllabi.rag.engine.check_for_ollama')
+    def test_load_passes_create_dirs(self, mock_check_ollama):
+        """Test that load forwards create_dirs when restoring a saved config."""
+        vectors_dir = self.base_dir / "test-run" / "vectors"
+        (vectors_dir / "vector.db").touch()
+        (vectors_dir / "metadata.json").write_text(json.dumps({"run_id": "test-run", "chunk_size": 128}))
+        
+        for create_dirs in (True, False):
+            with patch.object(RAGEngine, '__init__', return_value=None) as mock_init:
+                RAGEngine.load("test-run", base_dir=self.base_dir, create_dirs=create_dirs)
+                self.assertIs(mock_init.call_args.kwargs["create_dirs"], create_dirs)
+                self.assertEqual(mock_init.call_args.kwargs["chunk_size"], 128)
+
     @patch('osyllabi.rag.engine.VectorDatabase')
     @patch('osyllabi.rag.engine.EmbeddingGenerator')
     @patch('osyllabi.rag.engine.TextChunker')
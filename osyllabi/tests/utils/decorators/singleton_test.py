@@ -1,7 +1,8 @@
 """Tests for the singleton decorator."""
+import gc
 import unittest
 
-from osyllabi.utils.decorators.singleton import singleton
+from osyllabi.utils.decorators.singleton import singleton, reset_singleton, release_singleton
 
 
 @singleton
@@ -40,14 +41,21 @@ class Service:
         self.running = False
 
 
+@singleton(key=lambda name="default", *args, **kwargs: name)
+class NamedService:
+    def __init__(self, name: str = "default"):
+        self.name = name
+
+
 class TestSingletonDecorator(unittest.TestCase):
     """Test cases for the singleton decorator."""
     
     def setUp(self):
         """Reset the singleton registry before each test."""
         # Clear singleton instances to start fresh for each test
-        from osyllabi.utils.decorators.singleton import _instances
+        from osyllabi.utils.decorators.singleton import _instances, _keyed_instances
         _instances.clear()
+        _keyed_instances.clear()
 
     def test_single_instance(self):
         """Test that only one instance is created."""
@@ -110,3 +118,47 @@ class TestSingletonDecorator(unittest.TestCase):
         # Should be same instance with original settings
         self.assertIs(conf1, conf2)
         self.assertEqual(conf1.settings["debug"], True)
+
+    def test_keyed_singleton(self):
+        """Test that keyed singletons keep one instance per key."""
+        first = NamedService("alpha")
+        again = NamedService(name="alpha")
+        other = NamedService("beta")
+        
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(other.name, "beta")
+    
+    def test_reset_singleton(self):
+        """Test that resetting drops every instance of a class."""
+        first = NamedService("alpha")
+        db = DatabaseConnection()
+        
+        reset_singleton(NamedService)
+        
+        self.assertIsNot(NamedService("alpha"), first)
+        self.assertIs(DatabaseConnection(), db)
+
+    def test_keyed_singleton_freed_when_unreferenced(self):
+        """Test that keyed instances are not kept alive by the registry."""
+        from osyllabi.utils.decorators.singleton import _keyed_instances
+        
+        service = NamedService("gamma")
+        self.assertIn((NamedService, "gamma"), _keyed_instances)
+        
+        del service
+        gc.collect()
+        self.assertNotIn((NamedService, "gamma"), _keyed_instances)
+    
+    def test_release_singleton(self):
+        """Test that releasing an instance only drops that instance."""
+        first = NamedService("alpha")
+        other = NamedService("beta")
+        db = DatabaseConnection()
+        
+        release_singleton(first)
+        release_singleton(db)
+        
+        self.assertIsNot(NamedService("alpha"), first)
+        self.assertIs(NamedService("beta"), other)
+        self.assertIsNot(DatabaseConnection(), db)
@@ -0,0 +1,130 @@
+"""Tests for the context-aware logger."""
+import logging
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from osyllabi.utils.log import log, setup_logger
+
+
+class _RecordCollector(logging.Handler):
+    """Handler that keeps the context attached to each record."""
+
+    def __init__(self):
+        super().__init__()
+        self.contexts = []
+
+    def emit(self, record):
+        self.contexts.append(record.context)
+
+
+class TestContextAwareLogger(unittest.TestCase):
+    """Test cases for log context handling."""
+
+    def setUp(self):
+        """Attach a collecting handler and start without context."""
+        log.clear_context()
+        self.collector = _RecordCollector()
+        log.addHandler(self.collector)
+        self.previous_level = log.level
+        log.setLevel(logging.INFO)
+
+    def tearDown(self):
+        """Remove the collecting handler and any leftover context."""
+        log.removeHandler(self.collector)
+        log.setLevel(self.previous_level)
+        log.clear_context()
+
+    def test_empty_context(self):
+        """Test that records without context get an empty context string."""
+        log.info("message")
+        self.assertEqual(self.collector.contexts, [""])
+
+    def test_context_format(self):
+        """Test single and multiple context values."""
+        log.set_context(run="a")
+        log.info("one")
+        log.set_context(step=2)
+        log.info("two")
+        self.assertEqual(self.collector.contexts, [" - run=a", " - run=a, step=2"])
+
+    def test_nested_with_context_restores(self):
+        """Test that nested with_context blocks restore the outer context."""
+        log.set_context(run="a")
+        with log.with_context(step=1):
+            with log.with_context(step=2, agent="x"):
+                log.info("inner")
+            log.info("middle")
+        log.info("outer")
+
+        self.assertEqual(self.collector.contexts, [
+            " - run=a, step=2, agent=x",
+            " - run=a, step=1",
+            " - run=a"
+        ])
+
+    def test_clear_context(self):
+        """Test that clearing context drops the cached string."""
+        log.set_context(run="a")
+        log.info("before")
+        log.clear_context()
+        log.info("after")
+        self.assertEqual(self.collector.contexts, [" - run=a", ""])
+
+    def test_thread_isolation(self):
+        """Test that context set in one thread is not seen by another."""
+        log.set_context(run="main")
+
+        def worker():
+            log.info("worker before")
+            log.set_context(run="worker")
+            log.info("worker after")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        log.info("main")
+
+        self.assertEqual(self.collector.contexts, ["", " - run=worker", " - run=main"])
+
+
+class TestSetupLogger(unittest.TestCase):
+    """Test cases for setup_logger."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.name = f"osyllabi.tests.{self.id()}"
+
+    def tearDown(self):
+        logger = logging.getLogger(self.name)
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+        self.temp_dir.cleanup()
+
+    def test_same_config_keeps_handlers(self):
+        """Test that repeating the same setup does not rebuild handlers."""
+        log_file = str(Path(self.temp_dir.name) / "run.log")
+        logger = setup_logger(self.name, log_file=log_file)
+        handlers = list(logger.handlers)
+
+        self.assertIs(setup_logger(self.name, log_file=log_file), logger)
+        self.assertEqual(logger.handlers, handlers)
+
+    def test_changed_config_rebuilds_handlers(self):
+        """Test that a different level or an external level change rebuilds."""
+        logger = setup_logger(self.name)
+        handlers = list(logger.handlers)
+
+        setup_logger(self.name, level=logging.DEBUG)
+        self.assertNotEqual(logger.handlers, handlers)
+        self.assertEqual(logger.level, logging.DEBUG)
+
+        logger.setLevel(logging.ERROR)
+        setup_logger(self.name, level=logging.DEBUG)
+        self.assertEqual(logger.level, logging.DEBUG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,9 @@ from osyllabi.utils.vector.operations import (
     concatenate_vectors,
     reduce_dimensions,
     batch_cosine_similarity,
+    quantize_int8,
+    int8_cosine_similarity,
+    int8_row_norms,
     create_faiss_index,
     faiss_search,
     weighted_average_vectors,
@@ -170,6 +173,44 @@ class TestVectorOperations(unittest.TestCase):
         # Use higher tolerance for floating point precision issues with identical vectors
         self.assertAlmostEqual(similarities[3], 1.0, places=5)  # Reduced precision requirement
 
+    def test_quantize_int8(self):
+        """Test int8 quantization and similarity on quantized codes."""
+        vectors = [
+            [0.5, -0.25, 0.0],
+            [0.0, 0.0, 0.0],
+            [0.1, 0.2, 0.3]
+        ]
+        
+        codes, scales = quantize_int8(vectors)
+        
+        # Check shapes and dtypes
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(codes.shape, (3, 3))
+        self.assertEqual(scales.shape, (3, 1))
+        
+        # Largest magnitude maps to 127 and dequantization is close
+        self.assertEqual(codes[0, 0], 127)
+        np.testing.assert_allclose(codes * scales, vectors, atol=0.01)
+        
+        # Zero vector stays zero
+        self.assertTrue(np.all(codes[1] == 0))
+        
+        # Similarity on codes matches float cosine similarity
+        query_codes, _ = quantize_int8([0.1, 0.2, 0.3])
+        similarities = int8_cosine_similarity(query_codes, codes)
+        self.assertAlmostEqual(float(similarities[2]), 1.0, places=3)
+        self.assertAlmostEqual(float(similarities[1]), 0.0)
+        self.assertAlmostEqual(
+            float(similarities[0]),
+            cosine_similarity(vectors[0], vectors[2]),
+            places=2
+        )
+        
+        # Precomputed row norms give the same scores
+        norms = int8_row_norms(codes)
+        np.testing.assert_allclose(norms, np.linalg.norm(codes.astype(np.float64), axis=1), rtol=1e-6)
+        np.testing.assert_allclose(int8_cosine_similarity(query_codes, codes, norms), similarities)
+
     def test_weighted_average_vectors(self):
         """Test weighted average of vectors."""
         vectors = [
@@ -22,7 +22,7 @@ def register_command(name: str, handler_class: Type[Command]) -> None:
         handler_class: Command handler class
     """
     _command_handlers[name] = handler_class
-    log.debug(f"Registered command handler for '{name}': {handler_class.__name__}")
+    log.debug("Registered command handler for '%s': %s", name, handler_class.__name__)
 
 
 def get_command_handler(name: str) -> Optional[Command]:
@@ -2,32 +2,64 @@
 Help information display for CLI commands.
 """
 import sys
-import textwrap
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 
+from osyllabi import __version__
 from osyllabi.utils.cli.cmd_desc import COMMAND_DESC
 
 from osyllabi.utils.log import log
 
+# Flags that request help
+HELP_FLAGS = frozenset({'-h', '--help'})
+
+# Arguments that request help anywhere on the command line
+HELP_TOKENS = HELP_FLAGS | {'help'}
+
+# Static help sections, rendered once at import
+_HEADER_TEXT = (
+    "\nOsyllabi - A Python-powered curriculum designer\n"
+    f"Version: {__version__}\n\n"
+    "Generates personalized curriculums using AI, web crawling, and data integration.\n\n"
+)
+
+_GLOBAL_OPTIONS_TEXT = (
+    "\nGlobal Options:\n"
+    "  --help, -h         Display help for a command\n"
+    "  --debug            Enable debug mode for detailed logging and error information\n"
+    "\nRun 'osyllabi <command> --help' for more information on a specific command.\n"
+)
+
+_EPILOG_TEXT = (
+    "\nFor more information and examples, visit:\n"
+    "https://github.com/p3nGu1nZz/osyllabi\n"
+    "\n"
+    "Report issues at:\n"
+    "https://github.com/p3nGu1nZz/osyllabi/issues\n"
+    "\n"
+)
+
 
 def display_header() -> None:
     """Display the application header."""
-    from osyllabi import __version__
-    
-    print(f"\nOsyllabi - A Python-powered curriculum designer")
-    print(f"Version: {__version__}\n")
-    print("Generates personalized curriculums using AI, web crawling, and data integration.\n")
+    sys.stdout.write(_HEADER_TEXT)
 
 
-def get_command_usage_info(command_name: str) -> Tuple[str, Dict[str, str], List[str]]:
+@lru_cache(maxsize=8)
+def get_command_usage_info(
+    command_name: str
+) -> Tuple[str, Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[str, ...]]:
     """
     Get usage info for a specific command.
     
+    Results are cached per command name, so they are returned as immutable
+    tuples. Option descriptions are pre-split into their lines.
+    
     Args:
         command_name: Name of the command
         
     Returns:
-        Tuple containing usage string, options dict, and examples list
+        Tuple containing usage string, (option, description lines) pairs, and examples
     """
     # Default usage pattern
     usage = f"Usage: osyllabi {command_name}"
@@ -81,7 +113,117 @@ def get_command_usage_info(command_name: str) -> Tuple[str, Dict[str, str], List
             'osyllabi help --debug'
         ]
     
-    return usage, options, examples
+    option_items = tuple((opt, tuple(desc.split('\n'))) for opt, desc in options.items())
+    return usage, option_items, tuple(examples)
+
+
+@lru_cache(maxsize=8)
+def _option_lines(command_name: str) -> Tuple[str, ...]:
+    """
+    Get the formatted option lines for a command, aligned to its widest option.
+    
+    Args:
+        command_name: Name of the command
+        
+    Returns:
+        Option lines, with multi-line descriptions already expanded
+    """
+    _, option_items, _ = get_command_usage_info(command_name)
+    if not option_items:
+        return ()
+        
+    width = max(len(opt) for opt, _ in option_items)
+    lines = []
+    for opt, (first, *rest) in option_items:
+        lines.append(f"  {opt.ljust(width)}    {first}")
+        lines.extend(f"  {' ' * width}    {line}" for line in rest)
+    return tuple(lines)
+
+
+@lru_cache(maxsize=4)
+def _command_rows(descriptions: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """
+    Get the formatted, sorted command table rows for general help.
+    
+    Rows are cached per command table, so each table is sorted only once.
+    
+    Args:
+        descriptions: (command name, description) pairs
+        
+    Returns:
+        Command rows aligned to the longest command name
+    """
+    width = max(len(name) for name, _ in descriptions)
+    return tuple(f"  {name.ljust(width)}    {description}" for name, description in sorted(descriptions))
+
+
+@lru_cache(maxsize=8)
+def _render_command_help(command_name: str, description: str) -> str:
+    """
+    Render the help screen for a command, header included.
+    
+    Args:
+        command_name: Name of the command
+        description: Description of the command
+        
+    Returns:
+        Complete help text for the command
+    """
+    usage, option_items, examples = get_command_usage_info(command_name)
+    
+    lines = [
+        f"\nOSYLLABI {command_name.upper()}",
+        f"\n{description}\n",
+        usage
+    ]
+    
+    if option_items:
+        lines.append("\nOptions:" if not command_name == "help" else "\nArguments:")
+        lines.extend(_option_lines(command_name))
+    
+    if examples:
+        lines.append("\nExamples:")
+        lines.extend(f"  {example}" for example in examples)
+        
+    return _HEADER_TEXT + "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=4)
+def _render_general_help(descriptions: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Render the general help screen, header included.
+    
+    Args:
+        descriptions: (command name, description) pairs
+        
+    Returns:
+        Complete general help text
+    """
+    lines = [
+        "Usage: osyllabi [options] COMMAND [command-options]",
+        "\nCommands:",
+        *_command_rows(descriptions)
+    ]
+    
+    return _HEADER_TEXT + "\n".join(lines) + "\n" + _GLOBAL_OPTIONS_TEXT
+
+
+@lru_cache(maxsize=8)
+def _render_help(command: Optional[str]) -> str:
+    """
+    Render a full help screen for show_help, epilog included.
+    
+    Args:
+        command: Known command name, or None for general help
+        
+    Returns:
+        Complete help text ready to write
+    """
+    if command:
+        text = _render_command_help(command, COMMAND_DESC[command])
+    else:
+        text = _render_general_help(tuple(COMMAND_DESC.items()))
+    return text + _EPILOG_TEXT
 
 
 def display_command_help(command_name: str, command_descriptions: Dict[str, str]) -> None:
@@ -96,80 +238,46 @@ def display_command_help(command_name: str, command_descriptions: Dict[str, str]
         display_help_for_unknown_command(command_name)
         return
         
-    log.debug(f"Displaying help for command: {command_name}")
-    display_header()
-        
-    description = command_descriptions[command_name]
-    usage, options, examples = get_command_usage_info(command_name)
-    
-    print(f"\nOSYLLABI {command_name.upper()}")
-    print(f"\n{description}\n")
-    print(usage)
-    
-    if options:
-        print("\nOptions:" if not command_name == "help" else "\nArguments:")
-        max_opt_len = max(len(opt) for opt in options.keys())
-        for opt, desc in options.items():
-            desc_lines = desc.split('\n')
-            print(f"  {opt.ljust(max_opt_len)}    {desc_lines[0]}")
-            for line in desc_lines[1:]:
-                print(f"  {' ' * max_opt_len}    {line}")
-    
-    if examples:
-        print("\nExamples:")
-        for example in examples:
-            print(f"  {example}")
+    log.debug("Displaying help for command: %s", command_name)
+    sys.stdout.write(_render_command_help(command_name, command_descriptions[command_name]))
 
 
 def display_general_help(command_descriptions: Dict[str, str]) -> None:
     """Display general help for all commands."""
     log.debug("Displaying general help")
-    display_header()
-    
-    print("Usage: osyllabi [options] COMMAND [command-options]")
-    
-    print("\nCommands:")
-    max_len = max(len(name) for name in command_descriptions.keys())
-    for cmd_name, description in sorted(command_descriptions.items()):
-        print(f"  {cmd_name.ljust(max_len)}    {description}")
-    
-    print("\nGlobal Options:")
-    print("  --help, -h         Display help for a command")
-    print("  --debug            Enable debug mode for detailed logging and error information")
-    
-    print("\nRun 'osyllabi <command> --help' for more information on a specific command.")
+    sys.stdout.write(_render_general_help(tuple(command_descriptions.items())))
 
 
 def display_epilog() -> None:
     """Display epilog information after help text."""
-    epilog = textwrap.dedent("""\
-        For more information and examples, visit:
-        https://github.com/p3nGu1nZz/osyllabi
-        
-        Report issues at:
-        https://github.com/p3nGu1nZz/osyllabi/issues
-    """)
-    print("\n" + epilog)
+    sys.stdout.write(_EPILOG_TEXT)
 
 
 def display_help_for_unknown_command(attempted_command: str) -> None:
     """Display help message for an unknown command."""
-    log.warning(f"Unknown command requested: '{attempted_command}'")
+    log.warning("Unknown command requested: '%s'", attempted_command)
 
 
 def show_help(command: Optional[str] = None) -> None:
     """
     Display help information for commands.
     
+    Each help screen is rendered once and written with a single call.
+    
     Args:
         command: Specific command to show help for, or None for general help
     """
     if command:
-        display_command_help(command, COMMAND_DESC)
+        if command not in COMMAND_DESC:
+            display_help_for_unknown_command(command)
+            display_epilog()
+            return
+        log.debug("Displaying help for command: %s", command)
     else:
-        display_general_help(COMMAND_DESC)
+        command = None
+        log.debug("Displaying general help")
     
-    display_epilog()
+    sys.stdout.write(_render_help(command))
 
 
 def is_help_requested(args_list: Optional[List[str]] = None) -> bool:
@@ -185,4 +293,4 @@ def is_help_requested(args_list: Optional[List[str]] = None) -> bool:
     if args_list is None:
         args_list = sys.argv[1:]
         
-    return '-h' in args_list or '--help' in args_list or 'help' in args_list
+    return not HELP_TOKENS.isdisjoint(args_list)
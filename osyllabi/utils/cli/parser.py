@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
 from osyllabi.config import EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT
-from osyllabi.utils.cli.help import show_help
+from osyllabi.utils.cli.help import show_help, HELP_FLAGS
 
 def validate_path_arg(path: str, must_exist: bool = False) -> str:
     """
@@ -201,7 +201,7 @@ def parse_args(args: Optional[List[str]] = None) -> Union[argparse.Namespace, Tu
         args = sys.argv[1:]
         
     # Check for global help flags first (as a special case)
-    if not args or args[0] in ['-h', '--help']:
+    if not args or args[0] in HELP_FLAGS:
         return (True, None)  # Help requested with no specific command
         
     parser = setup_parser()
@@ -217,7 +217,7 @@ def parse_args(args: Optional[List[str]] = None) -> Union[argparse.Namespace, Tu
     except SystemExit as e:
         # On parse error, check if it looks like a help request
         cmd = None
-        if args and args[0] not in ['-h', '--help'] and not args[0].startswith('-'):
+        if args and args[0] not in HELP_FLAGS and not args[0].startswith('-'):
             cmd = args[0]
             
         return (True, cmd)
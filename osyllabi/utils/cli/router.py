@@ -48,7 +48,7 @@ def route_command(args: Optional[List[str]] = None) -> int:
     
     if handler:
         # Execute command
-        log.debug(f"Executing command: {command}")
+        log.debug("Executing command: %s", command)
         return handler.execute(parsed_args)
     else:
         log.error(f"Unknown command: {command}")
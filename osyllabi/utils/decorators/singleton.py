@@ -2,40 +2,61 @@
 Singleton decorator for ensuring only one instance of a class exists.
 """
 import functools
-from typing import Any, Dict, Type, TypeVar, cast
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Type, TypeVar, cast
 
 from osyllabi.utils.log import log
 
 # Type variable for generic typing
 T = TypeVar('T')
 
-# Registry of singleton instances
-_instances: Dict[Type, Any] = {}
+# Registry of singleton instances, keyed by class
+_instances: Dict[Hashable, Any] = {}
 
+# Registry of keyed singleton instances, keyed by (class, key). Values are held
+# weakly so per-key instances are freed once nothing else references them.
+_keyed_instances: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
 
-def singleton(cls: Type[T]) -> Type[T]:
+
+def singleton(
+    cls: Optional[Type[T]] = None,
+    *,
+    key: Optional[Callable[..., Hashable]] = None
+) -> Any:
     """
     Decorator that makes a class follow the singleton pattern.
     
     This decorator ensures only one instance of a class exists. If the class
-    is instantiated again, the existing instance is returned instead.
+    is instantiated again, the existing instance is returned instead. When a
+    key function is given, one instance is kept per key computed from the
+    constructor arguments; keyed instances are only kept while referenced
+    elsewhere.
     
     Args:
         cls: The class to make a singleton
+        key: Optional function mapping constructor arguments to an instance key
         
     Returns:
         Decorated class that follows the singleton pattern
     """
+    if cls is None:
+        return lambda decorated: singleton(decorated, key=key)
+        
     original_new = cls.__new__
     original_init = cls.__init__
     
     @functools.wraps(original_new)
     def __new__(cls, *args, **kwargs):
-        if cls not in _instances:
+        if key is None:
+            registry, registry_key = _instances, cls
+        else:
+            registry, registry_key = _keyed_instances, (cls, key(*args, **kwargs))
+            
+        instance = registry.get(registry_key)
+        if instance is None:
             instance = original_new(cls)
-            _instances[cls] = instance
-            return instance
-        return _instances[cls]
+            registry[registry_key] = instance
+        return instance
     
     @functools.wraps(original_init)
     def __init__(self, *args, **kwargs):
@@ -53,3 +74,30 @@ def singleton(cls: Type[T]) -> Type[T]:
     cls.__init__ = __init__
     
     return cls
+
+
+def reset_singleton(cls: Type) -> None:
+    """
+    Drop every registered instance of a singleton class.
+    
+    Args:
+        cls: The singleton class to reset
+    """
+    _instances.pop(cls, None)
+    for registry_key in [k for k in _keyed_instances.keys() if k[0] is cls]:
+        _keyed_instances.pop(registry_key, None)
+
+
+def release_singleton(instance: Any) -> None:
+    """
+    Drop a single instance from the singleton registry.
+    
+    The next instantiation with the same class (and key) creates a new
+    instance.
+    
+    Args:
+        instance: The singleton instance to release
+    """
+    for registry in (_instances, _keyed_instances):
+        for registry_key in [k for k, v in registry.items() if v is instance]:
+            registry.pop(registry_key, None)
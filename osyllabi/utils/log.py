@@ -8,6 +8,7 @@ import os
 import sys
 import logging
 import threading
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -20,43 +21,71 @@ WARNING = logging.WARNING
 ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 
+
+class _ThreadContext(threading.local):
+    """Thread local storage for context, initialized on first use in each thread."""
+    
+    def __init__(self):
+        self.context = {}
+        # Formatted context string, None when it must be rebuilt
+        self.context_str = None
+
+
 # Thread local storage for context
-_thread_local = threading.local()
+_thread_local = _ThreadContext()
 
 
+@lru_cache(maxsize=1)
 def is_debug_mode() -> bool:
     """
     Check if debug mode is enabled via environment variable.
     
+    The environment is read once per process; call ``is_debug_mode.cache_clear()``
+    after changing OSYLLABI_DEBUG at runtime.
+    
     Returns:
         bool: True if debug mode is enabled
     """
     return os.environ.get('OSYLLABI_DEBUG', '').lower() in ('1', 'true', 'yes')
 
 
-class ContextAwareFilter(logging.Filter):
-    """Filter that adds context information to log records."""
+def _context_string() -> str:
+    """
+    Get the formatted context for the current thread.
+    
+    The string is cached on the thread-local and rebuilt only after the
+    context changes.
     
-    def filter(self, record):
-        """Add context information to the record."""
-        # Get context from thread local storage or use empty dict
-        context = getattr(_thread_local, 'context', {})
+    Returns:
+        str: Context with a leading hyphen, or an empty string without context
+    """
+    # Reuse the formatted context until it changes
+    context_str = _thread_local.context_str
+    if context_str is None:
+        context = _thread_local.context
         
         # Format context as string - add a leading hyphen when context exists
-        if context:
-            record.context = f" - {', '.join(f'{k}={v}' for k, v in context.items())}"
+        if not context:
+            context_str = ""
+        elif len(context) == 1:
+            # Most contexts hold a single value, skip the generator and join
+            (key, value), = context.items()
+            context_str = f" - {key}={value}"
         else:
-            record.context = ""
-        return True
+            context_str = f" - {', '.join(f'{k}={v}' for k, v in context.items())}"
+        _thread_local.context_str = context_str
+        
+    return context_str
 
 
 class ContextAwareLogger(logging.Logger):
     """Logger that supports context information for each log message."""
     
-    def __init__(self, name: str, level: int = logging.NOTSET):
-        """Initialize the logger with the given name and level."""
-        super().__init__(name, level)
-        self.addFilter(ContextAwareFilter())
+    def makeRecord(self, *args, **kwargs) -> logging.LogRecord:
+        """Create a log record with the current thread's context attached."""
+        record = super().makeRecord(*args, **kwargs)
+        record.context = _context_string()
+        return record
         
     def set_context(self, **kwargs) -> None:
         """
@@ -65,15 +94,13 @@ class ContextAwareLogger(logging.Logger):
         Args:
             **kwargs: Key-value pairs to add to the context
         """
-        if not hasattr(_thread_local, 'context'):
-            _thread_local.context = {}
-            
         _thread_local.context.update(kwargs)
+        _thread_local.context_str = None
         
     def clear_context(self) -> None:
         """Clear all context values for the current thread."""
-        if hasattr(_thread_local, 'context'):
-            _thread_local.context.clear()
+        _thread_local.context.clear()
+        _thread_local.context_str = None
             
     def with_context(self, **kwargs):
         """
@@ -85,29 +112,32 @@ class ContextAwareLogger(logging.Logger):
         Returns:
             Context manager that restores previous context on exit
         """
-        class ContextManager:
-            def __init__(self, logger):
-                self.logger = logger
-                self.previous = {}
-                
-            def __enter__(self):
-                # Save the current context
-                if hasattr(_thread_local, 'context'):
-                    self.previous = _thread_local.context.copy()
-                else:
-                    self.previous = {}
-                
-                # Set the new context
-                self.logger.set_context(**kwargs)
-                return self.logger
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                if hasattr(_thread_local, 'context'):
-                    _thread_local.context.clear()
-                    if self.previous:
-                        _thread_local.context.update(self.previous)
-                
-        return ContextManager(self)
+        return _LoggerContextManager(self, kwargs)
+
+
+class _LoggerContextManager:
+    """Context manager that sets temporary context values on a logger."""
+    
+    __slots__ = ('logger', 'kwargs', 'previous')
+    
+    def __init__(self, logger: ContextAwareLogger, kwargs: dict):
+        self.logger = logger
+        self.kwargs = kwargs
+        self.previous = {}
+        
+    def __enter__(self):
+        # Save the current context
+        self.previous = _thread_local.context.copy()
+        
+        # Set the new context
+        self.logger.set_context(**self.kwargs)
+        return self.logger
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _thread_local.context.clear()
+        if self.previous:
+            _thread_local.context.update(self.previous)
+        _thread_local.context_str = None
 
 
 def setup_logger(
@@ -133,6 +163,13 @@ def setup_logger(
     
     # Get the logger
     logger = logging.getLogger(name)
+    
+    # Already configured this way, keep the existing handlers
+    config = (level, log_file, log_format)
+    if (getattr(logger, '_osyllabi_configured', None) == config
+            and logger.level == level and logger.handlers):
+        return logger
+        
     logger.setLevel(level)
     
     # Clear existing handlers to avoid duplicates
@@ -158,6 +195,7 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    logger._osyllabi_configured = config
     return logger
 
 
@@ -169,7 +207,10 @@ log = setup_logger(
 # Add module-level functions that delegate to the singleton
 def log_at_level(level: int, msg: str, *args, **kwargs) -> None:
     """Log a message at a specific level."""
-    log.log(level, msg, *args, **kwargs)
+    # Check the level here so disabled records skip the Logger.log call and
+    # its own argument checks
+    if log.isEnabledFor(level):
+        log.log(level, msg, *args, **kwargs)
 
 def debug(msg: str, *args, **kwargs) -> None:
     """Log a debug message."""
@@ -1,9 +1,6 @@
 """
 Vector operations and utilities.
 """
-import numpy as np
-
-from osyllabi.utils.log import log
 from osyllabi.utils.deps import DependencyManager
 
 # First import operations (including the FAISS_GPU_ENABLED flag)
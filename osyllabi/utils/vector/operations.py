@@ -20,6 +20,9 @@ import faiss
 # Define GPU capability flag here directly
 FAISS_GPU_ENABLED = DependencyManager._is_faiss_gpu_installed()
 
+# Rows of int8 codes upcast per block when computing similarities
+INT8_BLOCK_ROWS = 4096
+
 
 def cosine_similarity(v1: Union[List[float], np.ndarray], v2: Union[List[float], np.ndarray]) -> float:
     """
@@ -135,6 +138,77 @@ def concatenate_vectors(vectors: List[List[float]],
     return result
 
 
+def quantize_int8(vectors: Union[List[List[float]], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize vectors to int8 using a symmetric per-vector scale.
+    
+    Args:
+        vectors: Vectors to quantize (2D, or 1D for a single vector)
+        
+    Returns:
+        Tuple of (int8 codes, float32 scales) where codes * scales approximates
+        the original vectors. Scales have shape (n, 1).
+    """
+    np_vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    
+    scales = np.abs(np_vectors).max(axis=1, keepdims=True) / 127.0
+    scales[scales == 0] = 1.0  # Zero vectors quantize to zero codes
+    
+    codes = np.round(np_vectors / scales).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def int8_row_norms(codes: np.ndarray) -> np.ndarray:
+    """
+    Compute the L2 norm of each row of int8 codes.
+    
+    Args:
+        codes: Quantized vectors, shape (n, d)
+        
+    Returns:
+        np.ndarray: Row norms as float32, shape (n,)
+    """
+    norms = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), INT8_BLOCK_ROWS):
+        block = codes[start:start + INT8_BLOCK_ROWS].astype(np.float32)
+        norms[start:start + INT8_BLOCK_ROWS] = np.sqrt(np.einsum("ij,ij->i", block, block))
+    return norms
+
+
+def int8_cosine_similarity(
+    query_codes: np.ndarray,
+    codes: np.ndarray,
+    norms: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Compute cosine similarity between int8-quantized vectors.
+    
+    Per-vector scales cancel out in the cosine, so similarity is computed
+    directly on the codes. Codes are upcast to float32 one block of rows at a
+    time, which keeps the dot products on BLAS without materializing a full
+    upcast copy. Products of int8 codes stay exact in float32 for embedding
+    sizes up to 1040 dimensions.
+    
+    Args:
+        query_codes: Quantized query vector, shape (d,) or (1, d)
+        codes: Quantized vectors to compare against, shape (n, d)
+        norms: Precomputed row norms of codes (see int8_row_norms), computed
+            here when omitted
+        
+    Returns:
+        np.ndarray: Similarity scores, shape (n,)
+    """
+    q = np.asarray(query_codes, dtype=np.float32).reshape(-1)
+    if norms is None:
+        norms = int8_row_norms(codes)
+        
+    dots = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), INT8_BLOCK_ROWS):
+        dots[start:start + INT8_BLOCK_ROWS] = codes[start:start + INT8_BLOCK_ROWS].astype(np.float32) @ q
+        
+    return dots / (norms * np.sqrt(np.dot(q, q)) + 1e-8)
+
+
 def reduce_dimensions(vectors: List[List[float]], target_dims: int) -> List[List[float]]:
     """
     Reduce dimensionality of vectors using PCA.